@@ -5,11 +5,6 @@ import importlib.metadata
 import logging
 from typing import Any
 
-try:
-    __version__ = importlib.metadata.version("asynctasq")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.0.0"
-
 # Configuration
 from asynctasq.config import (
     Config,
@@ -86,6 +81,17 @@ from asynctasq.tasks import (
 from asynctasq.utils.console import Console, Panel, Syntax, Table, console, print
 from asynctasq.utils.loop import run
 
+
+def _get_version() -> str:
+    """Return the installed distribution version, or "0.0.0" when not installed."""
+    try:
+        return importlib.metadata.version("asynctasq")
+    except importlib.metadata.PackageNotFoundError:
+        return "0.0.0"
+
+
+__version__ = _get_version()
+
 logger = logging.getLogger(__name__)
 
 # Track whether we've registered cleanup hooks
@@ -285,6 +285,9 @@ class ProcessPoolManager:
     _async_pool: ProcessPoolExecutor | None = field(default=None, init=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
     _initialized: bool = field(default=False, init=False)
+    # Stats snapshots built once per pool creation (pool config is fixed for its lifetime)
+    _sync_stats: PoolStats | None = field(default=None, init=False)
+    _async_stats: PoolStats | None = field(default=None, init=False)
 
     async def __aenter__(self) -> Self:
         """Enter async context manager (initializes pools)."""
@@ -436,7 +439,7 @@ class ProcessPoolManager:
             },
         )
 
-        return ProcessPoolExecutor(
+        pool = ProcessPoolExecutor(
             max_workers=actual_max_workers,
             max_tasks_per_child=max_tasks_per_child,
             mp_context=actual_mp_context,
@@ -444,6 +447,20 @@ class ProcessPoolManager:
             initargs=initargs,
         )
 
+        # Snapshot stats once so get_stats() skips re-resolving sizes; it hands out
+        # copies, so callers cannot mutate the snapshot
+        stats = PoolStats(
+            status="initialized",
+            pool_size=actual_max_workers,
+            max_tasks_per_child=max_tasks_per_child,
+        )
+        if pool_type == "sync":
+            self._sync_stats = stats
+        else:
+            self._async_stats = stats
+
+        return pool
+
     def _get_cpu_count(self) -> int:
         """Get CPU count with fallback."""
         return getattr(os, "process_cpu_count", os.cpu_count)() or 4
@@ -474,6 +491,7 @@ class ProcessPoolManager:
                     errors.append(e)
                 finally:
                     self._sync_pool = None
+                    self._sync_stats = None
                     logger.info("Sync process pool reference cleared")
 
             if self._async_pool is not None:
@@ -488,6 +506,7 @@ class ProcessPoolManager:
                     errors.append(e)
                 finally:
                     self._async_pool = None
+                    self._async_stats = None
                     logger.info("Async process pool reference cleared")
 
             self._initialized = False
@@ -512,43 +531,35 @@ class ProcessPoolManager:
         """Get pool statistics.
 
         Returns:
-            Dict with sync/async pool status and configuration
+            Dict with sync/async pool status and configuration (copies of the
+            snapshots taken at pool creation, safe for callers to mutate)
         """
         with self._lock:
-            # Get actual pool sizes (resolve None to CPU count)
-            sync_pool_size = (
-                self.sync_max_workers
-                if self.sync_max_workers is not None
-                else self._get_cpu_count()
-            )
-            async_pool_size = (
-                self.async_max_workers
-                if self.async_max_workers is not None
-                else self._get_cpu_count()
-            )
-
-            sync_status: Literal["initialized", "not_initialized"] = (
-                "initialized" if self._sync_pool is not None else "not_initialized"
-            )
-            async_status: Literal["initialized", "not_initialized"] = (
-                "initialized" if self._async_pool is not None else "not_initialized"
-            )
-
+            sync_stats = self._sync_stats
+            async_stats = self._async_stats
             return {
-                "sync": PoolStats(
-                    status=sync_status,
-                    pool_size=sync_pool_size,
-                    max_tasks_per_child=self.sync_max_tasks_per_child
-                    or DEFAULT_MAX_TASKS_PER_CHILD,
+                "sync": sync_stats.copy()
+                if sync_stats is not None
+                else self._not_initialized_stats(
+                    self.sync_max_workers, self.sync_max_tasks_per_child
                 ),
-                "async": PoolStats(
-                    status=async_status,
-                    pool_size=async_pool_size,
-                    max_tasks_per_child=self.async_max_tasks_per_child
-                    or DEFAULT_MAX_TASKS_PER_CHILD,
+                "async": async_stats.copy()
+                if async_stats is not None
+                else self._not_initialized_stats(
+                    self.async_max_workers, self.async_max_tasks_per_child
                 ),
             }
 
+    def _not_initialized_stats(
+        self, max_workers: int | None, max_tasks_per_child: int | None
+    ) -> PoolStats:
+        """Build stats for a pool that has not been created yet (resolves None defaults)."""
+        return PoolStats(
+            status="not_initialized",
+            pool_size=max_workers if max_workers is not None else self._get_cpu_count(),
+            max_tasks_per_child=max_tasks_per_child or DEFAULT_MAX_TASKS_PER_CHILD,
+        )
+
 
 # Process-local default instance for convenience
 # Note: In multiprocessing, each process gets its own copy of this global
@@ -51,6 +51,8 @@ class FunctionResolver:
     _name_cache: dict[str, str] = {}
     # Cache for function references: {(module_name, func_name, func_file): callable}
     _func_cache: dict[tuple[str, str, str | None], Callable[..., Any]] = {}
+    # Cache for task classes: {(class_path, class_file): class}
+    _class_cache: dict[tuple[str, str | None], type] = {}
 
     @classmethod
     def get_module(cls, module_name: str, module_file: str | None = None) -> Any:
@@ -92,6 +94,11 @@ class FunctionResolver:
                 cls._module_cache[cache_key] = existing
                 return existing
 
+        # Validate the file before allocating a module name for it
+        main_file = Path(module_file)
+        if not main_file.exists():
+            raise FileNotFoundError(f"Cannot import from __main__ ({main_file} does not exist)")
+
         # Generate new unique module name using fast counter
         global _module_counter
         _module_counter += 1
@@ -99,10 +106,6 @@ class FunctionResolver:
         cls._name_cache[cache_key] = internal_module_name
 
         # Load module from file
-        main_file = Path(module_file)
-        if not main_file.exists():
-            raise FileNotFoundError(f"Cannot import from __main__ ({main_file} does not exist)")
-
         return cls._load_module_from_file(main_file, internal_module_name, cache_key, is_main=True)
 
     @classmethod
@@ -259,10 +262,47 @@ class FunctionResolver:
         cls._func_cache[cache_key] = result
         return result
 
+    @classmethod
+    def get_class_reference(cls, class_path: str, class_file: str | None = None) -> type:
+        """Get task class from its "module.ClassName" path (handles __main__ module).
+
+        Args:
+            class_path: Dotted class path (e.g., "myapp.tasks.SendEmail")
+            class_file: Optional file path for __main__ resolution
+
+        Returns:
+            Task class
+
+        Raises:
+            ValueError: If class_path is not in "module.ClassName" format
+            ImportError: If module/class cannot be loaded
+            AttributeError: If the module has no such class
+            FileNotFoundError: If __main__ file doesn't exist
+        """
+        # Fast path: skips path parsing, module lookup and Path.resolve for __main__
+        cache_key = (class_path, class_file)
+        cached_class = cls._class_cache.get(cache_key)
+        if cached_class is not None:
+            return cached_class
+
+        # Parse class path - validate format first
+        last_dot = class_path.rfind(".")
+        if last_dot <= 0:  # No dot found (-1) or dot at start (0) is invalid
+            raise ValueError(
+                f"Invalid class path format: '{class_path}' (must be 'module.ClassName')"
+            )
+
+        module = cls.get_module(class_path[:last_dot], class_file)
+        task_class = getattr(module, class_path[last_dot + 1 :])
+
+        cls._class_cache[cache_key] = task_class
+        return task_class
+
     @classmethod
     def clear_cache(cls) -> None:
-        """Clear all caches (module, name, function, and LRU import cache)."""
+        """Clear all caches (module, name, function, class, and LRU import cache)."""
         cls._module_cache.clear()
         cls._name_cache.clear()
         cls._func_cache.clear()
+        cls._class_cache.clear()
         _cached_import.cache_clear()
@@ -38,6 +38,8 @@ class TaskSerializer:
         self.serializer = serializer or MsgspecSerializer()
         self._task_info_converter = TaskInfoConverter(self.serializer)
         self._function_resolver = FunctionResolver()
+        # Serialized class path and source file per task class: {class: (class_path, file)}
+        self._class_info_cache: dict[type, tuple[str, str | None]] = {}
 
     def serialize(self, task: BaseTask) -> bytes:
         """Serialize task to bytes.
@@ -101,14 +103,16 @@ class TaskSerializer:
             if func_file:
                 metadata["func_file"] = func_file
 
-        # Normalize module name for __main__ modules
-        module_name = task.__class__.__module__
-        if module_name.startswith("__asynctasq_main_"):
-            module_name = "__main__"
+        # Class path and file never change for a class - compute them once
+        task_class = task.__class__
+        class_info = self._class_info_cache.get(task_class)
+        if class_info is None:
+            class_info = self._class_info_cache[task_class] = self._get_class_info(task_class)
+        class_path, class_file = class_info
 
         # Build final task dict
         task_data: dict[str, Any] = {
-            "class": f"{module_name}.{task.__class__.__name__}",
+            "class": class_path,
             "params": params,
             "metadata": metadata,
         }
@@ -117,16 +121,29 @@ class TaskSerializer:
         original_file = getattr(task, "_original_class_file", None)
         if original_file:
             task_data["class_file"] = original_file
-        else:
-            try:
-                class_file = inspect.getfile(task.__class__)
-                if class_file and class_file[0] != "<":
-                    task_data["class_file"] = class_file
-            except (TypeError, OSError):
-                pass
+        elif class_file:
+            task_data["class_file"] = class_file
 
         return self.serializer.serialize(task_data)
 
+    @staticmethod
+    def _get_class_info(task_class: type) -> tuple[str, str | None]:
+        """Get serialized class path (__main__-normalized) and source file for a task class."""
+        # Normalize module name for __main__ modules
+        module_name = task_class.__module__
+        if module_name.startswith("__asynctasq_main_"):
+            module_name = "__main__"
+
+        class_file: str | None = None
+        try:
+            file = inspect.getfile(task_class)
+            if file and file[0] != "<":
+                class_file = file
+        except (TypeError, OSError):
+            pass
+
+        return f"{module_name}.{task_class.__name__}", class_file
+
     async def deserialize(self, task_data: bytes) -> BaseTask:
         """Deserialize bytes to task instance.
 
@@ -146,18 +163,8 @@ class TaskSerializer:
         metadata: dict[str, Any] = task_dict["metadata"]
         class_file: str | None = task_dict.get("class_file")
 
-        # Parse class path - validate format first
-        last_dot = class_path.rfind(".")
-        if last_dot <= 0:  # No dot found (-1) or dot at start (0) is invalid
-            raise ValueError(
-                f"Invalid class path format: '{class_path}' (must be 'module.ClassName')"
-            )
-        module_name = class_path[:last_dot]
-        class_name = class_path[last_dot + 1 :]
-
-        # Load module and get class
-        module = self._function_resolver.get_module(module_name, class_file)
-        task_class = getattr(module, class_name)
+        # Resolve task class (cached per class path and file)
+        task_class = self._function_resolver.get_class_reference(class_path, class_file)
 
         # Create task instance
         if is_function_task_class(task_class):
@@ -2,7 +2,7 @@
 
 This module provides the AsyncProcessTask class for async CPU-intensive operations
 that need to run in separate processes to bypass Python's GIL (Global Interpreter Lock).
-Uses warm event loops for optimal performance, with fallback to on-demand loop creation.
+Uses warm event loops for optimal performance, with fallback to a per-process loop runner.
 """
 
 from __future__ import annotations
@@ -19,10 +19,32 @@ from asynctasq.tasks.infrastructure.process_pool_manager import (
     get_warm_event_loop,
     increment_fallback_count,
 )
-from asynctasq.utils.loop import run
+from asynctasq.tasks.utils.execution_helpers import get_worker_runner
 
 logger = logging.getLogger(__name__)
 
+# Source file per task class for __reduce__ (None if not a real file): {class: file}
+_class_file_cache: dict[type, str | None] = {}
+
+
+def _get_class_file(task_class: type) -> str | None:
+    """Get the source file of a task class, computed once per class."""
+    try:
+        return _class_file_cache[task_class]
+    except KeyError:
+        pass
+
+    try:
+        class_file: str | None = inspect.getfile(task_class)
+        # Only store if it's a real file (not built-in or C extension)
+        if class_file and class_file.startswith("<"):
+            class_file = None
+    except (TypeError, OSError):
+        class_file = None
+
+    _class_file_cache[task_class] = class_file
+    return class_file
+
 
 class AsyncProcessTask(BaseTask):
     """Asynchronous CPU-bound task executed in a separate process.
@@ -93,7 +115,7 @@ class AsyncProcessTask(BaseTask):
         """Run async execute() using warm event loop with fallback.
 
         Attempts to use a pre-initialized warm event loop for performance.
-        Falls back to creating a new loop if warm loop is unavailable.
+        Falls back to the process's reusable loop runner if warm loop is unavailable.
 
         Returns
         -------
@@ -102,7 +124,7 @@ class AsyncProcessTask(BaseTask):
 
         Warnings
         --------
-        Logs a warning if fallback loop creation is used, as this has
+        Logs a warning if the fallback runner is used, as this has
         performance impact. Initialize the process pool manager during
         worker startup to enable warm loops.
         """
@@ -113,11 +135,11 @@ class AsyncProcessTask(BaseTask):
             future = asyncio.run_coroutine_threadsafe(self.execute(), process_loop)
             return future.result()
 
-        # Fallback path: create new event loop (performance impact)
+        # Fallback path: warm loop initializer did not run in this process
         current_count = increment_fallback_count()
 
         logger.warning(
-            "Warm event loop not available, falling back to on-demand loop creation",
+            "Warm event loop not available, falling back to the process's loop runner",
             extra={
                 "task_class": self.__class__.__name__,
                 "fallback_count": current_count,
@@ -125,8 +147,9 @@ class AsyncProcessTask(BaseTask):
                 "recommendation": "Call manager.initialize() during worker startup",
             },
         )
-        # Use the event loop runner to create and run a new loop
-        return run(self.execute())
+        # Reuse one loop across fallback calls instead of creating one per task;
+        # AsyncTasQ resources opened on it are released once at process exit
+        return get_worker_runner().run(self.execute())
 
     @abstractmethod
     async def execute(self) -> Any:
@@ -166,15 +189,7 @@ class AsyncProcessTask(BaseTask):
             Reduction tuple: (callable, args) where callable(*args) reconstructs the object
         """
         # Get the class file path for reliable reconstruction
-        class_file = getattr(self, "_original_class_file", None)
-        if not class_file:
-            try:
-                class_file = inspect.getfile(self.__class__)
-                # Only store if it's a real file (not built-in or C extension)
-                if class_file and class_file.startswith("<"):
-                    class_file = None
-            except (TypeError, OSError):
-                class_file = None
+        class_file = getattr(self, "_original_class_file", None) or _get_class_file(self.__class__)
 
         # Prepare reconstruction data
         return (
@@ -89,9 +89,9 @@ class SyncProcessTask(BaseTask):
         from asynctasq.tasks.services.serializer import TaskSerializer
         from asynctasq.tasks.utils.execution_helpers import _sync_process_task_worker
 
-        # Serialize this task instance
-        serializer = TaskSerializer()
-        serialized_task = serializer.serialize(self)
+        # Serialize this task instance (fresh serializer per call: its encode buffer
+        # must not be shared between threads dispatching tasks concurrently)
+        serialized_task = TaskSerializer().serialize(self)
 
         # Get the process pool
         pool = get_default_manager().get_sync_pool()
@@ -9,11 +9,23 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from functools import cache
+import logging
+from multiprocessing.util import Finalize
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from concurrent.futures import Executor
 
+    from asynctasq.tasks.services.serializer import TaskSerializer
+
+logger = logging.getLogger(__name__)
+
+# Process-local runner for pool workers without a warm loop (SyncProcessTask
+# deserialization, AsyncProcessTask fallback)
+# (created on first use, reused for every later task in the same process)
+_worker_runner: asyncio.Runner | None = None
+
 
 async def execute_in_thread(sync_callable: Callable[[], Any]) -> Any:
     """Execute synchronous callable in the default ThreadPoolExecutor.
@@ -66,19 +78,68 @@ def _sync_process_task_worker(serialized_task: bytes) -> Any:
     Any
         The result from the task's execute() method
     """
-    import asyncio
-
-    from asynctasq.tasks.services.serializer import TaskSerializer
+    from asynctasq.tasks.infrastructure.process_pool_manager import get_warm_event_loop
 
-    # Deserialize the task using asyncio.run since deserialize is async
-    serializer = TaskSerializer()
-    task = asyncio.run(serializer.deserialize(serialized_task))
+    # Deserialize on this process's long-lived event loop since deserialize is async
+    coro = _get_task_serializer().deserialize(serialized_task)
+    warm_loop = get_warm_event_loop()
+    if warm_loop is not None:
+        task = asyncio.run_coroutine_threadsafe(coro, warm_loop).result()
+    else:
+        task = get_worker_runner().run(coro)
 
     # Execute the task's execute() method (which is synchronous for SyncProcessTask)
     # Type ignore because we know this is a SyncProcessTask at runtime
     return task.execute()  # type: ignore[attr-defined]
 
 
+@cache
+def _get_task_serializer() -> TaskSerializer:
+    """Get the TaskSerializer that pool workers reuse to deserialize SyncProcessTask payloads.
+
+    Worker side only: each pool process runs one task at a time, so sharing the
+    instance is safe there, unlike in the dispatching process.
+    """
+    from asynctasq.tasks.services.serializer import TaskSerializer
+
+    return TaskSerializer()
+
+
+def get_worker_runner() -> asyncio.Runner:
+    """Get the event loop runner reused by process tasks when no warm loop exists.
+
+    Avoids creating and tearing down an event loop per task, and keeps async
+    resources (e.g. ORM connection pools) bound to a single loop.
+    """
+    global _worker_runner
+    if _worker_runner is None:
+        from asynctasq.utils.loop import get_loop_factory
+
+        # Same loop flavour as asynctasq.utils.loop.run() (uvloop when available)
+        _worker_runner = asyncio.Runner(loop_factory=get_loop_factory())
+        # Finalize (not atexit): pool workers started with fork/forkserver exit via
+        # os._exit() and skip atexit, but run multiprocessing finalizers on the way out
+        Finalize(None, _close_worker_runner, args=(_worker_runner,), exitpriority=10)
+    return _worker_runner
+
+
+def _close_worker_runner(runner: asyncio.Runner) -> None:
+    """Release AsyncTasQ resources opened on the runner's loop, then close it.
+
+    Mirrors the cleanup asynctasq.utils.loop.run() does after each coroutine:
+    dispatcher drivers and a configured SQLAlchemy AsyncEngine are released
+    before the loop goes away.
+    """
+    from asynctasq.utils.loop import cleanup_asynctasq
+
+    try:
+        runner.run(cleanup_asynctasq())
+    except Exception as e:
+        logger.debug(f"AsyncTasQ cleanup completed with warnings: {e}")
+    finally:
+        runner.close()
+
+
 async def execute_in_process_sync(sync_callable: Callable[[], Any]) -> Any:
     """Execute synchronous callable in ProcessPoolExecutor for CPU-bound work.
 
@@ -20,7 +20,7 @@ from collections.abc import Callable
 import inspect
 import logging
 from typing import Any
-from weakref import WeakKeyDictionary
+from weakref import WeakKeyDictionary, ref
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +32,20 @@ class _RegistryEntry:
     """Manages cleanup callbacks for a single event loop."""
 
     def __init__(self, loop: asyncio.AbstractEventLoop):
-        self.loop = loop
+        # Weak, like the registry key: a strong reference from the entry (the
+        # registry's value) would keep the loop, and so the entry, alive forever
+        self._loop_ref = ref(loop)
         self.callbacks: list[Callable[[], Any]] = []
-        self._original_close: Callable[[], None] | None = None
         self._patched = False
 
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop this entry belongs to."""
+        loop = self._loop_ref()
+        if loop is None:
+            raise RuntimeError("Event loop has already been garbage collected")
+        return loop
+
     def add_callback(self, callback: Callable[[], Any]) -> None:
         """Add a cleanup callback."""
         if callback not in self.callbacks:
@@ -52,27 +61,30 @@ class _RegistryEntry:
         if self._patched:
             return
 
-        # Store the original close method
-        self._original_close = self.loop.close
+        loop = self.loop
+        # The closure below lives on the loop itself, so it may reference the loop
+        # (directly and via the bound original close) without keeping it alive; the
+        # entry must not, since the registry holds entries strongly
+        original_close = loop.close
 
         # Create a new close method that runs cleanup first
         def close_with_cleanup():
             """Close the loop after running cleanup callbacks."""
             try:
-                # Run cleanup callbacks synchronously
-                self._run_cleanup_sync()
+                # Run cleanup callbacks synchronously (pass the loop: when close() runs
+                # from the loop's __del__, the entry's weak reference is already cleared)
+                self._run_cleanup_sync(loop)
             except Exception as e:
                 logger.exception(f"Error during asyncio cleanup: {e}")
             finally:
                 # Call the original close method
-                if self._original_close:
-                    self._original_close()
+                original_close()
 
         # Replace the loop's close method
-        self.loop.close = close_with_cleanup  # type: ignore
+        loop.close = close_with_cleanup  # type: ignore
         self._patched = True
 
-    def _run_cleanup_sync(self) -> None:
+    def _run_cleanup_sync(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
         """Run cleanup callbacks synchronously.
 
         This is called when the loop is being closed, so we can't use
@@ -91,18 +103,20 @@ class _RegistryEntry:
         # Make a copy to avoid modification during iteration
         callbacks = self.callbacks.copy()
 
+        if loop is None:
+            loop = self.loop
         for callback in callbacks:
             callback_name = getattr(callback, "__name__", str(callback))
             try:
                 if inspect.iscoroutinefunction(callback):
                     # For async callbacks, we need to run them with run_until_complete
                     # if the loop is not already closed
-                    if not self.loop.is_closed() and not self.loop.is_running():
+                    if not loop.is_closed() and not loop.is_running():
                         # Safe to run async callback
-                        self.loop.run_until_complete(callback())
+                        loop.run_until_complete(callback())
                     else:
                         # Cannot run async callback - loop is closed or running
-                        loop_state = "closed" if self.loop.is_closed() else "running"
+                        loop_state = "closed" if loop.is_closed() else "running"
                         logger.warning(
                             f"Cannot run async cleanup callback '{callback_name}' "
                             f"- loop is {loop_state}. Consider running cleanup earlier."
@@ -13,13 +13,41 @@ Best Practices Applied (2025):
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
+from functools import cache
 import logging
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Resolve the loop factory once at import instead of probing for uvloop on every run()
+_loop_factory: Callable[[], asyncio.AbstractEventLoop] | None
+try:
+    import uvloop
 
-async def _cleanup_asynctasq():
+    _loop_factory = uvloop.new_event_loop
+    _using_uvloop = True
+except ImportError:
+    _loop_factory = None  # asyncio.Runner's default loop
+    _using_uvloop = False
+
+
+@cache
+def _get_async_engine_type() -> type | None:
+    """Get SQLAlchemy's AsyncEngine class, or None when SQLAlchemy is not installed."""
+    try:
+        from sqlalchemy.ext.asyncio import AsyncEngine
+    except ImportError:
+        return None
+    return AsyncEngine
+
+
+def get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the event loop factory run() uses (uvloop's, or None for asyncio's default)."""
+    return _loop_factory
+
+
+async def cleanup_asynctasq():
     """Cleanup AsyncTasQ resources if initialized."""
     try:
         from asynctasq.core.dispatcher import cleanup
@@ -33,18 +61,19 @@ async def _cleanup_asynctasq():
 
     # Cleanup user-supplied SQLAlchemy engine
     try:
-        from sqlalchemy.ext.asyncio import AsyncEngine
-
         from asynctasq.config import Config
 
-        config = Config.get()
-        if config.sqlalchemy_engine and isinstance(config.sqlalchemy_engine, AsyncEngine):
+        engine = Config.get().sqlalchemy_engine
+        if engine is None:
+            # Common case: nothing to dispose, so skip the SQLAlchemy import and type check
+            return
+
+        async_engine_type = _get_async_engine_type()
+        if async_engine_type is not None and isinstance(engine, async_engine_type):
             try:
-                await config.sqlalchemy_engine.dispose()
+                await engine.dispose()
             except Exception:
                 pass
-    except ImportError:
-        pass
     except Exception:
         pass
 
@@ -104,29 +133,17 @@ def run(coro: Any):
     # Use asyncio.Runner with uvloop for best performance
     # This is the modern recommended approach per 2025 best practices (Python 3.11+)
     # Since min supported version is 3.12, we always use Runner
-    try:
-        import uvloop
-
-        # Use Runner with uvloop factory - combines best of both worlds
-        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        if _using_uvloop:
             logger.debug("Using asyncio.Runner with uvloop")
-            try:
-                return runner.run(coro)
-            finally:
-                # Runner handles asyncgens and executor shutdown automatically
-                # We only need to cleanup AsyncTasQ resources
-                try:
-                    runner.run(_cleanup_asynctasq())
-                except Exception as e:
-                    logger.debug(f"AsyncTasQ cleanup completed with warnings: {e}")
-    except ImportError:
-        # uvloop not available, use standard Runner
-        with asyncio.Runner() as runner:
+        else:
             logger.debug("Using asyncio.Runner (uvloop not available)")
+        try:
+            return runner.run(coro)
+        finally:
+            # Runner handles asyncgens and executor shutdown automatically
+            # We only need to cleanup AsyncTasQ resources
             try:
-                return runner.run(coro)
-            finally:
-                try:
-                    runner.run(_cleanup_asynctasq())
-                except Exception as e:
-                    logger.debug(f"AsyncTasQ cleanup completed with warnings: {e}")
+                runner.run(cleanup_asynctasq())
+            except Exception as e:
+                logger.debug(f"AsyncTasQ cleanup completed with warnings: {e}")
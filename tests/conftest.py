@@ -5,7 +5,8 @@ event loop for each test and performs proper cleanup. The project requires
 uvloop to be available in the test environment.
 
 It also provides an `ensure_migrations` fixture that automatically runs
-database migrations for PostgreSQL and MySQL before any tests execute.
+database migrations for PostgreSQL and MySQL before any tests execute, and a
+`no_running_loop` fixture for synchronous tests of "no running loop" code paths.
 """
 
 from __future__ import annotations
@@ -38,6 +39,19 @@ def event_loop():
             loop.close()
 
 
+@pytest.fixture
+def no_running_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make asyncio.get_running_loop() raise RuntimeError, as it does outside a loop.
+
+    Only for synchronous tests: async tests run inside a loop that needs the real function.
+    """
+
+    def get_running_loop() -> asyncio.AbstractEventLoop:
+        raise RuntimeError("no running event loop")
+
+    monkeypatch.setattr(asyncio, "get_running_loop", get_running_loop)
+
+
 @pytest.fixture(scope="session", autouse=True)
 def ensure_migrations():
     """Ensure database migrations are run before any tests execute.
@@ -5,6 +5,8 @@ across test files, particularly for common task patterns.
 """
 
 import asyncio
+from collections.abc import Callable, Generator
+from typing import Any
 
 import pytest
 
@@ -14,6 +16,10 @@ from asynctasq.tasks.infrastructure.process_pool_manager import (
     get_default_manager,
     set_default_manager,
 )
+from asynctasq.tasks.utils import execution_helpers
+
+# Finalize registrations captured by fresh_worker_runner: (obj, callback, args, exitpriority)
+_FinalizeCalls = list[tuple[Any, Callable[..., Any], tuple[Any, ...], int | None]]
 
 
 def factorial(n: int) -> int:
@@ -90,3 +96,28 @@ def reset_default_manager(event_loop):
             event_loop.run_until_complete(fresh_manager.shutdown(wait=True, cancel_futures=True))
     except Exception:
         pass  # Ignore cleanup errors
+
+
+@pytest.fixture
+def fresh_worker_runner(monkeypatch: pytest.MonkeyPatch) -> Generator[_FinalizeCalls, None, None]:
+    """Start the test without a process-local worker runner and close any it creates.
+
+    multiprocessing finalizers registered by execution_helpers are recorded instead
+    of being installed in the pytest process; the recorded calls are yielded to the test.
+    """
+    registered: _FinalizeCalls = []
+
+    def finalize(
+        obj: Any,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        exitpriority: int | None = None,
+    ) -> None:
+        registered.append((obj, callback, args, exitpriority))
+
+    monkeypatch.setattr(execution_helpers, "_worker_runner", None)
+    monkeypatch.setattr(execution_helpers, "Finalize", finalize)
+    yield registered
+    if execution_helpers._worker_runner is not None:
+        execution_helpers._worker_runner.close()
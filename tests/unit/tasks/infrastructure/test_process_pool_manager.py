@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+import concurrent.futures
+import multiprocessing
+import signal
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pytest import main
 
-from asynctasq.tasks.infrastructure.process_pool_manager import ProcessPoolManager
+import asynctasq.tasks.infrastructure.process_pool_manager as ppm
+from asynctasq.tasks.infrastructure.process_pool_manager import (
+    DEFAULT_MAX_TASKS_PER_CHILD,
+    ProcessPoolManager,
+    _cleanup_warm_event_loop,
+    _get_safe_mp_context,
+    _setup_subprocess_io,
+    get_default_manager,
+    get_fallback_count,
+    get_warm_event_loop,
+    increment_fallback_count,
+    set_default_manager,
+)
 
 
 @pytest.fixture
@@ -29,14 +46,15 @@ class TestProcessPoolManagerHealthMonitoring:
         manager.get_sync_pool()  # Trigger auto-initialization
         assert manager.is_initialized()
 
-    def test_is_initialized_returns_false_after_shutdown(self, manager: ProcessPoolManager) -> None:
+    def test_is_initialized_returns_false_after_shutdown(
+        self, manager: ProcessPoolManager, event_loop: asyncio.AbstractEventLoop
+    ) -> None:
         """Test is_initialized returns False after shutdown."""
         manager.get_sync_pool()  # Trigger auto-initialization
         assert manager.is_initialized()
 
-        from asynctasq.utils.loop import run
-
-        run(manager.shutdown(wait=True))
+        # Reuse the per-test loop already created for reset_default_manager
+        event_loop.run_until_complete(manager.shutdown(wait=True))
         assert not manager.is_initialized()
 
     def test_get_stats_not_initialized(self, manager: ProcessPoolManager) -> None:
@@ -70,11 +88,27 @@ class TestProcessPoolManagerHealthMonitoring:
         assert stats["sync"]["pool_size"] == 2
         assert stats["sync"]["max_tasks_per_child"] == 100
 
+    def test_get_stats_reuses_snapshot_until_shutdown(
+        self, event_loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Test get_stats returns copies of the snapshot built at pool creation."""
+        test_manager = ProcessPoolManager(sync_max_workers=2)
+        test_manager.get_sync_pool()  # Trigger initialization
+
+        first = test_manager.get_stats()["sync"]
+        second = test_manager.get_stats()["sync"]
+        assert first == second
+        assert first is not second
+
+        # Mutating a returned dict must not leak into later calls
+        first["pool_size"] = 99
+        assert test_manager.get_stats()["sync"]["pool_size"] == 2
+
+        event_loop.run_until_complete(test_manager.shutdown(wait=True))
+        assert test_manager.get_stats()["sync"]["status"] == "not_initialized"
+
     def test_is_initialized_thread_safe(self, manager: ProcessPoolManager) -> None:
         """Test that is_initialized is thread-safe."""
-        import concurrent.futures
-        import threading
-
         results = []
         lock = threading.Lock()
 
@@ -96,9 +130,6 @@ class TestProcessPoolManagerHealthMonitoring:
 
     def test_get_stats_thread_safe(self, manager: ProcessPoolManager) -> None:
         """Test that get_stats is thread-safe."""
-        import concurrent.futures
-        import threading
-
         results = []
         lock = threading.Lock()
 
@@ -127,67 +158,54 @@ class TestProcessPoolManagerHealthMonitoring:
 class TestProcessPoolManagerValidation:
     """Test ProcessPoolManager input validation (Issue #16)."""
 
-    def test_initialize_with_invalid_type_raises_type_error(
-        self, manager: ProcessPoolManager
+    @pytest.mark.parametrize(
+        ("max_workers", "expected_error"),
+        [("invalid", TypeError), (3.5, TypeError), (0, ValueError), (-5, ValueError)],
+    )
+    def test_initialize_with_invalid_max_workers_raises(
+        self, max_workers: object, expected_error: type[Exception]
     ) -> None:
-        """Test that non-integer max_workers raises TypeError when pool is created."""
-        test_manager = ProcessPoolManager(sync_max_workers="invalid")  # type: ignore
-        with pytest.raises(TypeError):
-            test_manager.get_sync_pool()  # Error occurs here
-
-    def test_initialize_with_float_raises_type_error(self, manager: ProcessPoolManager) -> None:
-        """Test that float max_workers raises TypeError when pool is created."""
-        test_manager = ProcessPoolManager(sync_max_workers=3.5)  # type: ignore
-        with pytest.raises(TypeError):
+        """Test that invalid max_workers raises when the pool is created."""
+        test_manager = ProcessPoolManager(sync_max_workers=max_workers)  # type: ignore[arg-type]
+        with pytest.raises(expected_error):
             test_manager.get_sync_pool()  # Error occurs here
 
-    def test_initialize_with_zero_raises_value_error(self, manager: ProcessPoolManager) -> None:
-        """Test that max_workers=0 raises ValueError when pool is created."""
-        test_manager = ProcessPoolManager(sync_max_workers=0)
-        with pytest.raises(ValueError):
-            test_manager.get_sync_pool()  # Error occurs here
-
-    def test_initialize_with_negative_raises_value_error(self, manager: ProcessPoolManager) -> None:
-        """Test that negative max_workers raises ValueError when pool is created."""
-        test_manager = ProcessPoolManager(sync_max_workers=-5)
-        with pytest.raises(ValueError):
-            test_manager.get_sync_pool()  # Error occurs here
-
-    def test_initialize_with_max_allowed_value_succeeds(self, manager: ProcessPoolManager) -> None:
-        """Test that max_workers=1000 (large value) succeeds."""
-        test_manager = ProcessPoolManager(sync_max_workers=1000)
+    @pytest.mark.parametrize("max_workers", [1, 4, None])
+    def test_initialize_with_valid_max_workers_succeeds(self, max_workers: int | None) -> None:
+        """Test that valid max_workers (boundary, typical, default) succeeds."""
+        test_manager = ProcessPoolManager(sync_max_workers=max_workers)
         test_manager.get_sync_pool()  # Trigger initialization
         assert test_manager.is_initialized()
         stats = test_manager.get_stats()
-        assert stats["sync"]["pool_size"] == 1000
+        if max_workers is None:
+            # Should default to CPU count or 4
+            assert stats["sync"]["pool_size"] >= 1
+        else:
+            assert stats["sync"]["pool_size"] == max_workers
+
+    def test_initialize_with_max_allowed_value_succeeds(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that max_workers=1000 (large value) reaches the executor unchanged."""
+        created: dict[str, int] = {}
 
-    def test_initialize_with_valid_value_succeeds(self, manager: ProcessPoolManager) -> None:
-        """Test that valid max_workers succeeds."""
-        test_manager = ProcessPoolManager(sync_max_workers=4)
-        test_manager.get_sync_pool()  # Trigger initialization
-        assert test_manager.is_initialized()
-        stats = test_manager.get_stats()
-        assert stats["sync"]["pool_size"] == 4
+        class FakePool:
+            def __init__(self, max_workers: int, **kwargs: object) -> None:
+                created["max_workers"] = max_workers
 
-    def test_initialize_with_none_uses_default(self, manager: ProcessPoolManager) -> None:
-        """Test that max_workers=None uses CPU count default."""
-        test_manager = ProcessPoolManager(sync_max_workers=None)
-        test_manager.get_sync_pool()  # Trigger initialization
-        assert test_manager.is_initialized()
-        stats = test_manager.get_stats()
-        # Should default to CPU count or 4
-        assert stats["sync"]["pool_size"] is not None
-        assert stats["sync"]["pool_size"] >= 1
+            def shutdown(self, **kwargs: object) -> None:
+                pass
 
-    def test_initialize_with_boundary_value_one(self, manager: ProcessPoolManager) -> None:
-        """Test that max_workers=1 (minimum) succeeds."""
-        test_manager = ProcessPoolManager(sync_max_workers=1)
+        # Record the requested size without building a real 1000-worker executor
+        monkeypatch.setattr(ppm, "ProcessPoolExecutor", FakePool)
+
+        test_manager = ProcessPoolManager(sync_max_workers=1000)
         test_manager.get_sync_pool()  # Trigger initialization
         assert test_manager.is_initialized()
-        stats = test_manager.get_stats()
-        assert stats["sync"]["pool_size"] == 1
+        assert created["max_workers"] == 1000
+        assert test_manager.get_stats()["sync"]["pool_size"] == 1000
 
-    def test_error_message_includes_helpful_context(self, manager: ProcessPoolManager) -> None:
+    def test_error_message_includes_helpful_context(self) -> None:
         """Test that error messages from ProcessPoolExecutor are clear."""
         test_manager = ProcessPoolManager(sync_max_workers=0)
         with pytest.raises(ValueError) as exc_info:
@@ -218,8 +236,6 @@ class TestProcessPoolManagerAdvanced:
     @pytest.mark.asyncio
     async def test_initialize_warm_event_loop(self) -> None:
         """Test initialize() sets up warm event loops."""
-        from unittest.mock import patch
-
         # Arrange
         manager = ProcessPoolManager(async_max_workers=2)
 
@@ -327,11 +343,6 @@ class TestProcessPoolManagerAdvanced:
     @pytest.mark.asyncio
     async def test_fallback_count_functions(self) -> None:
         """Test get_fallback_count() and increment_fallback_count()."""
-        from asynctasq.tasks.infrastructure.process_pool_manager import (
-            get_fallback_count,
-            increment_fallback_count,
-        )
-
         # Arrange - get initial count
         initial = get_fallback_count()
 
@@ -348,8 +359,6 @@ class TestProcessPoolManagerAdvanced:
     @pytest.mark.asyncio
     async def test_get_warm_event_loop_returns_none_outside_process(self) -> None:
         """Test get_warm_event_loop() returns None outside process pool."""
-        from asynctasq.tasks.infrastructure.process_pool_manager import get_warm_event_loop
-
         # Act
         loop = get_warm_event_loop()
 
@@ -359,8 +368,6 @@ class TestProcessPoolManagerAdvanced:
     @pytest.mark.asyncio
     async def test_get_default_manager_returns_singleton(self) -> None:
         """Test get_default_manager() returns same instance."""
-        from asynctasq.tasks.infrastructure.process_pool_manager import get_default_manager
-
         # Act
         manager1 = get_default_manager()
         manager2 = get_default_manager()
@@ -371,11 +378,6 @@ class TestProcessPoolManagerAdvanced:
     @pytest.mark.asyncio
     async def test_set_default_manager_replaces_instance(self) -> None:
         """Test set_default_manager() replaces default instance."""
-        from asynctasq.tasks.infrastructure.process_pool_manager import (
-            get_default_manager,
-            set_default_manager,
-        )
-
         # Arrange
         original = get_default_manager()
         custom = ProcessPoolManager(sync_max_workers=8)
@@ -407,10 +409,8 @@ class TestProcessPoolManagerAdvanced:
     @pytest.mark.asyncio
     async def test_manager_with_custom_mp_context(self) -> None:
         """Test ProcessPoolManager with custom multiprocessing context."""
-        import multiprocessing as mp
-
         # Arrange
-        ctx = mp.get_context("spawn")  # Force spawn method
+        ctx = multiprocessing.get_context("spawn")  # Force spawn method
         manager = ProcessPoolManager(sync_max_workers=2, mp_context=ctx)
 
         # Act
@@ -467,14 +467,6 @@ class TestProcessPoolManagerWarmEventLoop:
     @pytest.mark.asyncio
     async def test_cleanup_warm_event_loop_stops_loop(self) -> None:
         """Test _cleanup_warm_event_loop stops the event loop."""
-        from unittest.mock import MagicMock
-
-        # Mock process loop
-        import asynctasq.tasks.infrastructure.process_pool_manager as ppm
-        from asynctasq.tasks.infrastructure.process_pool_manager import (
-            _cleanup_warm_event_loop,
-        )
-
         original_loop = ppm._process_loop
 
         try:
@@ -498,11 +490,6 @@ class TestProcessPoolManagerWarmEventLoop:
     @pytest.mark.asyncio
     async def test_setup_subprocess_io_configures_signals(self) -> None:
         """Test _setup_subprocess_io sets up signal handlers."""
-        import signal
-        from unittest.mock import patch
-
-        from asynctasq.tasks.infrastructure.process_pool_manager import _setup_subprocess_io
-
         with patch("signal.signal") as mock_signal:
             _setup_subprocess_io()
 
@@ -515,15 +502,9 @@ class TestProcessPoolManagerWarmEventLoop:
     @pytest.mark.asyncio
     async def test_get_safe_mp_context_returns_spawn(self) -> None:
         """Test _get_safe_mp_context returns spawn context."""
-        import multiprocessing
-
-        from asynctasq.tasks.infrastructure.process_pool_manager import _get_safe_mp_context
-
         ctx = _get_safe_mp_context()
         # Verify it's a spawn context by checking it matches spawn context
         assert ctx == multiprocessing.get_context("spawn")
-        from asynctasq.tasks.infrastructure.process_pool_manager import DEFAULT_MAX_TASKS_PER_CHILD
-
         assert DEFAULT_MAX_TASKS_PER_CHILD == 100
         assert isinstance(DEFAULT_MAX_TASKS_PER_CHILD, int)
 
@@ -591,8 +572,6 @@ class TestProcessPoolManagerEdgeCases:
     @pytest.mark.asyncio
     async def test_get_cpu_count_fallback(self) -> None:
         """Test _get_cpu_count handles os.cpu_count returning None."""
-        from unittest.mock import patch
-
         manager = ProcessPoolManager()
 
         with patch("os.cpu_count", return_value=None):
@@ -624,9 +603,7 @@ class TestProcessPoolManagerEdgeCases:
     @pytest.mark.asyncio
     async def test_initialize_with_custom_mp_context(self) -> None:
         """Test initialize with custom multiprocessing context."""
-        import multiprocessing as mp
-
-        custom_ctx = mp.get_context("spawn")
+        custom_ctx = multiprocessing.get_context("spawn")
         manager = ProcessPoolManager(sync_max_workers=2, mp_context=custom_ctx)
 
         await manager.initialize()
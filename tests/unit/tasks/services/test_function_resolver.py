@@ -1,652 +1,502 @@
 """Unit tests for asynctasq.tasks.services.function_resolver module."""
 
-import gc
+from collections.abc import Callable, Iterator
+from functools import cache
+import hashlib
+import importlib.abc
+from importlib.machinery import ModuleSpec
+import importlib.util
+import itertools
 import os
 from pathlib import Path
 import sys
-import tempfile
-from unittest.mock import MagicMock, Mock, patch
+import types
+from typing import Any
 
 import pytest
 
 from asynctasq.tasks.services.function_resolver import FunctionResolver
 
+# Unique suffixes for module names registered in sys.modules by the tests
+_uniq = itertools.count().__next__
 
-class TestFunctionResolver:
-    """Test FunctionResolver class."""
+CANONICAL_SOURCE = "TEST_VAR = 'hello'\nTEST_INT = 42\n"
 
-    def setup_method(self):
-        """Clear cache before each test."""
-        FunctionResolver.clear_cache()
 
-    def teardown_method(self):
-        """Clean up after each test."""
-        FunctionResolver.clear_cache()
-        # Force garbage collection to prevent semaphore leaks from mock objects
-        gc.collect()
+@pytest.fixture(scope="session")
+def make_py_file(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str], str]:
+    """Factory writing module source into one shared directory, deduplicated by content."""
+    root = tmp_path_factory.mktemp("function_resolver")
 
-    def test_get_module_regular_module(self):
-        """Test get_module with regular module."""
-        # Test with a standard library module
-        module = FunctionResolver.get_module("os")
-        assert module is not None
-        assert hasattr(module, "path")
+    def make(content: str) -> str:
+        digest = hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+        path = root / f"mod_{digest}.py"
+        if not path.exists():
+            path.write_text(content)
+        return str(path)
 
-    def test_get_module_regular_module_from_file(self):
-        """Test get_module loads regular module from file when not in path."""
-        # Create a temporary Python file with a unique module name
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("x = 42\n")
-            temp_file = f.name
+    return make
 
-        try:
-            # Use a module name that definitely doesn't exist
-            module_name = f"definitely_not_importable_module_{id(self)}_{hash(temp_file)}"
-
-            import builtins
-
-            original_import = builtins.__import__
-            import_called = []
-
-            def mock_import(name, *args, **kwargs):
-                import_called.append(name)
-                try:
-                    return original_import(name, *args, **kwargs)
-                except ModuleNotFoundError:
-                    import_called.append(f"failed: {name}")
-                    raise
-
-            with patch.object(builtins, "__import__", mock_import):
-                module = FunctionResolver.get_module(module_name, temp_file)
-                print(f"Import calls: {import_called}")
-                assert module is not None
-                assert hasattr(module, "x")
-                assert module.x == 42
-        finally:
-            os.unlink(temp_file)
 
-    def test_get_module_regular_module_from_file_cached(self):
-        """Test get_module caches file-loaded modules."""
-        # Create a temporary Python file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("CACHED_VAR = 'cached'\n")
-            temp_file = f.name
+@pytest.fixture(scope="class")
+def canonical_py(make_py_file: Callable[[str], str]) -> str:
+    """One trivial module shared by tests that only need *a* file (or patch its loader)."""
+    return make_py_file(CANONICAL_SOURCE)
 
-        try:
-            module_name = f"cached_module_{hash(temp_file)}"
-            # Load first time
-            module1 = FunctionResolver.get_module(module_name, temp_file)
-            assert module1.CACHED_VAR == "cached"
-
-            # Load second time - should use cache
-            module2 = FunctionResolver.get_module(module_name, temp_file)
-            assert module1 is module2  # Same instance from cache
-        finally:
-            os.unlink(temp_file)
 
-    def test_get_module_regular_module_from_file_existing_in_sys_modules(self):
-        """Test get_module uses module already in sys.modules."""
-        # Create a temporary Python file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("SYS_MODULES_VAR = 'from sys.modules'\n")
-            temp_file = f.name
+@pytest.fixture
+def in_memory_py(canonical_py: str, monkeypatch: pytest.MonkeyPatch) -> str:
+    """canonical_py path whose source the resolver executes from memory, not disk."""
+    loader = _MemLoader(CANONICAL_SOURCE, canonical_py)
 
-        module_name = f"sys_modules_module_{hash(temp_file)}"
-        try:
-            # Manually add to sys.modules
-            import types
+    def spec_from_file_location(name: str, location: Any, **kwargs: Any) -> ModuleSpec | None:
+        return importlib.util.spec_from_loader(name, loader, origin=str(location))
 
-            fake_module = types.ModuleType(module_name)
-            fake_module.test_attr = "from sys.modules"  # type: ignore
-            sys.modules[module_name] = fake_module
+    monkeypatch.setattr(importlib.util, "spec_from_file_location", spec_from_file_location)
+    return canonical_py
 
-            # Should return the one from sys.modules
-            module = FunctionResolver.get_module(module_name, temp_file)
-            assert module is fake_module
-            assert module.test_attr == "from sys.modules"  # type: ignore
-        finally:
-            sys.modules.pop(module_name, None)
-            os.unlink(temp_file)
 
-    @patch("importlib.util.spec_from_file_location")
-    def test_get_module_regular_module_from_file_spec_failure(self, mock_spec_from_file):
-        """Test get_module raises ImportError when spec creation fails."""
-        mock_spec_from_file.return_value = None  # Spec is None
+@pytest.fixture
+def stub_spec(monkeypatch: pytest.MonkeyPatch) -> Callable[[Any], None]:
+    """Make importlib.util.spec_from_file_location return a given spec for the test."""
 
-        # Create a temporary Python file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("SPEC_FAILURE_VAR = 'spec failed'\n")
-            temp_file = f.name
+    def stub(spec: Any) -> None:
+        monkeypatch.setattr(importlib.util, "spec_from_file_location", lambda *a, **kw: spec)
 
-        try:
-            module_name = f"spec_failure_module_{hash(temp_file)}"
-            with pytest.raises(ImportError, match="Failed to load spec"):
-                FunctionResolver.get_module(module_name, temp_file)
-        finally:
-            os.unlink(temp_file)
+    return stub
 
-    def test_get_module_main_without_file(self):
-        """Test get_module with __main__ but no file raises ImportError."""
-        with pytest.raises(
-            ImportError, match="Cannot import from __main__ \\(missing module_file\\)"
-        ):
-            FunctionResolver.get_module("__main__")
 
-    def test_get_module_main_nonexistent_file(self):
-        """Test get_module with __main__ and nonexistent file raises FileNotFoundError."""
-        with pytest.raises(FileNotFoundError, match="does not exist"):
-            FunctionResolver.get_module("__main__", "/nonexistent/file.py")
+@pytest.fixture
+def inject_main_module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Callable[..., str]:
+    """Register a ready-made __main__ module so the resolver returns it without loading.
 
-    def test_get_module_main_cached(self):
-        """Test get_module caches __main__ modules."""
-        # Create a temporary Python file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("TEST_VAR = 'hello'\n")
-            temp_file = f.name
+    Seeds the name cache and sys.modules the way a previous load would have, and
+    returns the (never written) file path to resolve it by.
+    """
 
-        try:
-            # First call should load and cache
-            module1 = FunctionResolver.get_module("__main__", temp_file)
+    def inject(**attrs: Any) -> str:
+        main_file = str(tmp_path / f"main_{_uniq()}.py")
+        internal_name = f"__asynctasq_main_test_{_uniq()}__"
+        module = types.ModuleType(internal_name)
+        module.__dict__.update(attrs)
+        FunctionResolver._name_cache[_resolved(main_file)] = internal_name
+        monkeypatch.setitem(sys.modules, internal_name, module)
+        return main_file
 
-            # Second call should return cached version
-            module2 = FunctionResolver.get_module("__main__", temp_file)
+    return inject
 
-            # Should be the same object
-            assert module1 is module2
-            assert hasattr(module1, "TEST_VAR")
-            assert module1.TEST_VAR == "hello"
 
-        finally:
-            Path(temp_file).unlink()
+class _MemLoader(importlib.abc.Loader):
+    """Loader that compiles module source held in memory."""
 
-    def test_get_module_main_spec_failure(self):
-        """Test get_module with spec creation failure."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            temp_file = f.name
+    def __init__(self, source: str, path: str) -> None:
+        self.source = source
+        self.path = path
 
-        try:
-            with patch("importlib.util.spec_from_file_location", return_value=None):
-                with pytest.raises(ImportError, match="Failed to load spec"):
-                    FunctionResolver.get_module("__main__", temp_file)
-        finally:
-            Path(temp_file).unlink()
+    def create_module(self, spec: ModuleSpec) -> None:
+        return None
 
-    def test_get_module_main_loader_failure(self):
-        """Test get_module with loader failure."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            temp_file = f.name
+    def exec_module(self, module: types.ModuleType) -> None:
+        exec(compile(self.source, self.path, "exec"), module.__dict__)
 
-        try:
-            mock_spec = MagicMock()
-            mock_spec.loader = None
 
-            with patch("importlib.util.spec_from_file_location", return_value=mock_spec):
-                with pytest.raises(ImportError, match="Failed to load spec"):
-                    FunctionResolver.get_module("__main__", temp_file)
-        finally:
-            Path(temp_file).unlink()
+class _RaisingLoader(importlib.abc.Loader):
+    """Loader whose exec_module raises ``exc`` (no-op when None)."""
 
-    def test_get_module_main_exec_runtime_error(self):
-        """Test get_module with RuntimeError during exec."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("# Test file\n")
-            temp_file = f.name
+    def __init__(self, exc: BaseException | None) -> None:
+        self.exc = exc
 
-        try:
-            mock_spec = MagicMock()
-            mock_loader = MagicMock()
-            mock_loader.exec_module.side_effect = RuntimeError(
-                "cannot be called from a running event loop"
-            )
-            mock_spec.loader = mock_loader
-
-            with patch("importlib.util.spec_from_file_location", return_value=mock_spec):
-                with pytest.raises(
-                    RuntimeError, match="cannot be called from a running event loop"
-                ):
-                    FunctionResolver.get_module("__main__", temp_file)
-        finally:
-            Path(temp_file).unlink()
+    def create_module(self, spec: ModuleSpec) -> None:
+        return None
 
-    def test_get_module_main_exec_general_error(self):
-        """Test get_module with general exception during exec."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("# Test file\n")
-            temp_file = f.name
+    def exec_module(self, module: types.ModuleType) -> None:
+        if self.exc is not None:
+            raise self.exc
 
-        try:
-            mock_spec = MagicMock()
-            mock_loader = MagicMock()
-            mock_loader.exec_module.side_effect = ValueError("Some error")
-            mock_spec.loader = mock_loader
-
-            with patch("importlib.util.spec_from_file_location", return_value=mock_spec):
-                with pytest.raises(ValueError, match="Some error"):
-                    FunctionResolver.get_module("__main__", temp_file)
-        finally:
-            Path(temp_file).unlink()
 
-    def test_get_module_main_existing_in_sys_modules(self):
-        """Test get_module caching behavior for __main__ modules."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("TEST_VAR = 'existing'\n")
-            temp_file = f.name
+def fake_spec(exc: BaseException | None = None) -> ModuleSpec:
+    """Real ModuleSpec whose loader raises ``exc`` from exec_module (no-op when None)."""
+    return ModuleSpec("fake_module", _RaisingLoader(exc))
 
-        try:
-            # First call loads the module
-            FunctionResolver.clear_cache()
-            module1 = FunctionResolver.get_module("__main__", temp_file)
-            assert module1.TEST_VAR == "existing"
 
-            # Second call returns cached module (same identity)
-            module2 = FunctionResolver.get_module("__main__", temp_file)
-            assert module2 is module1
+@pytest.fixture
+def fake_django(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
+    """Install minimal ``django``/``django.conf`` modules with a fresh, patchable LazySettings."""
 
-        finally:
-            Path(temp_file).unlink()
-            FunctionResolver.clear_cache()
+    class LazySettings:
+        def configure(self, *args: Any, **kwargs: Any) -> None:
+            return None
 
-    def test_get_function_reference_regular_module(self):
-        """Test get_function_reference with regular module."""
-        func_ref = FunctionResolver.get_function_reference("os", "path")
-        assert func_ref is not None
+    django = types.SimpleNamespace(conf=types.SimpleNamespace(settings=LazySettings()))
+    monkeypatch.setitem(sys.modules, "django", django)
+    monkeypatch.setitem(sys.modules, "django.conf", django.conf)
+    return django
 
-    def test_get_function_reference_main_module(self):
-        """Test get_function_reference with __main__ module."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def test_func():\n    return 'test'\n")
-            temp_file = f.name
 
-        try:
-            func_ref = FunctionResolver.get_function_reference("__main__", "test_func", temp_file)
-            assert callable(func_ref)
-            assert func_ref() == "test"
-        finally:
-            Path(temp_file).unlink()
+def _spec_must_not_be_built(*args: Any, **kwargs: Any) -> None:
+    pytest.fail("spec_from_file_location should not be called")
 
-    def test_get_module_regular_module_from_file_spec_none(self):
-        """Test get_module with regular module from file when spec is None."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def test_func():\n    return 'test'\n")
-            temp_file = f.name
 
-        try:
-            with patch(
-                "builtins.__import__",
-                side_effect=ModuleNotFoundError("No module named 'test_module'"),
-            ):
-                with patch("importlib.util.spec_from_file_location", return_value=None):
-                    with pytest.raises(ImportError, match="Failed to load spec"):
-                        FunctionResolver.get_module("test_module", module_file=temp_file)
-        finally:
-            Path(temp_file).unlink()
+@cache
+def _resolved(path: str) -> str:
+    """Absolute path the resolver uses as its cache key (resolved once per file)."""
+    return str(Path(path).resolve())
 
-    def test_get_module_regular_module_from_file_loader_none(self):
-        """Test get_module with regular module from file when spec.loader is None."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def test_func():\n    return 'test'\n")
-            temp_file = f.name
 
-        try:
-            mock_spec = MagicMock()
-            mock_spec.loader = None
-            with patch(
-                "builtins.__import__",
-                side_effect=ModuleNotFoundError("No module named 'test_module'"),
-            ):
-                with patch("importlib.util.spec_from_file_location", return_value=mock_spec):
-                    with pytest.raises(ImportError, match="Failed to load spec"):
-                        FunctionResolver.get_module("test_module", module_file=temp_file)
-        finally:
-            Path(temp_file).unlink()
+def _internal_main_name(module_file: str) -> str:
+    """Internal sys.modules name the resolver allocated for a __main__ file."""
+    return FunctionResolver._name_cache[_resolved(module_file)]
 
-    def test_get_module_regular_module_from_file_exec_module_not_found_error(self):
-        """Test get_module with regular module from file when exec_module raises ModuleNotFoundError."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def test_func():\n    return 'test'\n")
-            temp_file = f.name
 
-        try:
-            mock_spec = MagicMock()
-            mock_loader = MagicMock()
-            mock_spec.loader = mock_loader
-            mock_loader.exec_module.side_effect = ModuleNotFoundError("missing_module")
-
-            with patch(
-                "builtins.__import__",
-                side_effect=ModuleNotFoundError("No module named 'test_module'"),
-            ):
-                with patch("importlib.util.spec_from_file_location", return_value=mock_spec):
-                    with patch("importlib.util.module_from_spec") as mock_module_from_spec:
-                        # Use Mock instead of MagicMock to avoid semaphore leaks
-                        mock_module = Mock()
-                        mock_module_from_spec.return_value = mock_module
-                        with pytest.raises(ImportError, match="has missing dependencies"):
-                            FunctionResolver.get_module("test_module", module_file=temp_file)
-        finally:
-            Path(temp_file).unlink()
+class TestFunctionResolver:
+    """Test FunctionResolver class."""
 
-    def test_get_module_regular_module_from_file_exec_module_general_error(self):
-        """Test get_module with regular module from file when exec_module raises general Exception."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def test_func():\n    return 'test'\n")
-            temp_file = f.name
+    @pytest.fixture(autouse=True)
+    def _reset_resolver_caches(self) -> Iterator[None]:
+        """Clear FunctionResolver's class-level caches once per test, on the way out."""
+        yield
+        FunctionResolver.clear_cache()
 
-        try:
-            mock_spec = MagicMock()
-            mock_loader = MagicMock()
-            mock_spec.loader = mock_loader
-            mock_loader.exec_module.side_effect = ValueError("some error")
-
-            with patch(
-                "builtins.__import__",
-                side_effect=ModuleNotFoundError("No module named 'test_module'"),
-            ):
-                with patch("importlib.util.spec_from_file_location", return_value=mock_spec):
-                    with patch("importlib.util.module_from_spec") as mock_module_from_spec:
-                        # Use Mock instead of MagicMock to avoid semaphore leaks
-                        mock_module = Mock()
-                        mock_module_from_spec.return_value = mock_module
-                        with pytest.raises(ValueError, match="some error"):
-                            FunctionResolver.get_module("test_module", module_file=temp_file)
-        finally:
-            Path(temp_file).unlink()
+    @pytest.mark.parametrize(("name", "expected_attr"), [("os", "path"), ("json", "loads")])
+    def test_get_module_stdlib(self, name: str, expected_attr: str):
+        """Test get_module resolves standard library modules via the import fast path."""
+        module = FunctionResolver.get_module(name)
+        assert module is sys.modules[name]
+        assert getattr(module, expected_attr) is not None
 
-    def test_get_module_regular_module_no_file_reraise_error(self):
-        """Test get_module with regular module when __import__ fails and no module_file provided."""
-        with patch(
-            "builtins.__import__",
-            side_effect=ModuleNotFoundError("No module named 'nonexistent_module'"),
-        ):
-            with pytest.raises(ModuleNotFoundError, match="No module named 'nonexistent_module'"):
-                FunctionResolver.get_module("nonexistent_module", module_file=None)
+    def test_get_module_regular_module_from_file(self, make_py_file: Callable[[str], str]):
+        """Test get_module loads regular module from file when not in path."""
+        temp_file = make_py_file("x = 42\n")
 
-    def test_clear_cache(self):
-        """Test clear_cache method."""
-        # Add something to cache
-        FunctionResolver._module_cache["test"] = "value"
+        # Use a module name that definitely doesn't exist
+        module_name = f"definitely_not_importable_module_{_uniq()}"
 
-        FunctionResolver.clear_cache()
+        # Nothing by that name is importable, so the resolver falls back to the file
+        module = FunctionResolver.get_module(module_name, temp_file)
 
-        assert len(FunctionResolver._module_cache) == 0
+        assert module.x == 42
 
-    def test_get_function_reference_unwraps_task_wrapper(self):
-        """Test get_function_reference unwraps TaskFunctionWrapper."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(
-                "def wrapped_func():\n"
-                "    return 'unwrapped'\n"
-                "\n"
-                "wrapped_func.__wrapped__ = lambda: 'original'\n"
-            )
-            temp_file = f.name
+    def test_get_module_regular_module_from_file_cached(self, make_py_file: Callable[[str], str]):
+        """Test get_module caches file-loaded modules."""
+        temp_file = make_py_file("CACHED_VAR = 'cached'\n")
 
-        try:
-            func_ref = FunctionResolver.get_function_reference(
-                "__main__", "wrapped_func", temp_file
-            )
-            # Should return the __wrapped__ attribute
-            assert func_ref() == "original"
-        finally:
-            Path(temp_file).unlink()
+        module_name = f"cached_module_{_uniq()}"
+        # Load first time
+        module1 = FunctionResolver.get_module(module_name, temp_file)
+        assert module1.CACHED_VAR == "cached"
 
-    def test_get_function_reference_without_wrapper(self):
-        """Test get_function_reference returns function as-is when not wrapped."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def plain_func():\n    return 'plain'\n")
-            temp_file = f.name
+        # Load second time - should use cache
+        module2 = FunctionResolver.get_module(module_name, temp_file)
+        assert module1 is module2  # Same instance from cache
 
-        try:
-            func_ref = FunctionResolver.get_function_reference("__main__", "plain_func", temp_file)
-            assert func_ref() == "plain"
-        finally:
-            Path(temp_file).unlink()
+    def test_get_module_regular_module_from_file_existing_in_sys_modules(
+        self, canonical_py: str, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test get_module uses module already in sys.modules."""
 
-    def test_get_module_main_with_django_patching(self):
-        """Test get_module patches Django settings.configure when Django is loaded."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("# Test file with potential Django import\n")
-            temp_file = f.name
+        module_name = f"sys_modules_module_{_uniq()}"
+        # Manually add to sys.modules
+        fake_module = types.ModuleType(module_name)
+        fake_module.test_attr = "from sys.modules"  # type: ignore
+        monkeypatch.setitem(sys.modules, module_name, fake_module)
+
+        # Should return the one from sys.modules without building a spec
+        monkeypatch.setattr(importlib.util, "spec_from_file_location", _spec_must_not_be_built)
+        module = FunctionResolver.get_module(module_name, canonical_py)
+        assert module is fake_module
+        assert module.test_attr == "from sys.modules"  # type: ignore
+
+    def test_get_module_regular_module_from_file_spec_failure(
+        self, canonical_py: str, stub_spec: Callable[[Any], None]
+    ):
+        """Test get_module raises ImportError when spec creation fails."""
+        stub_spec(None)  # Spec is None
 
-        try:
-            # Mock Django being imported
-            mock_django = MagicMock()
-            mock_settings = MagicMock()
+        module_name = f"spec_failure_module_{_uniq()}"
+        with pytest.raises(ImportError, match="Failed to load spec"):
+            FunctionResolver.get_module(module_name, canonical_py)
 
-            mock_django.conf.settings = mock_settings
+    def test_get_module_main_without_file(self):
+        """Test get_module with __main__ but no file raises ImportError."""
+        with pytest.raises(
+            ImportError, match="Cannot import from __main__ \\(missing module_file\\)"
+        ):
+            FunctionResolver.get_module("__main__")
 
-            with patch.dict(
-                "sys.modules", {"django": mock_django, "django.conf": mock_django.conf}
-            ):
-                # Act
-                module = FunctionResolver.get_module("__main__", temp_file)
+    def test_get_module_main_nonexistent_file(self):
+        """Test get_module with __main__ and nonexistent file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="does not exist"):
+            FunctionResolver.get_module("__main__", "/nonexistent/file.py")
 
-                # Assert module was loaded
-                assert module is not None
-        finally:
-            Path(temp_file).unlink()
+    def test_get_module_main_cached(self, in_memory_py: str):
+        """Test get_module caches __main__ modules."""
+        # First call should load and cache
+        module1 = FunctionResolver.get_module("__main__", in_memory_py)
 
-    def test_get_module_main_django_patch_restoration(self):
-        """Test Django settings.configure is restored after loading."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("test_var = 42\n")
-            temp_file = f.name
+        # Second call should return cached version
+        module2 = FunctionResolver.get_module("__main__", in_memory_py)
 
-        try:
-            # Mock Django with a real configure method
-            mock_django = MagicMock()
-            mock_settings = MagicMock()
+        # Should be the same object
+        assert module1 is module2
+        assert hasattr(module1, "TEST_VAR")
+        assert module1.TEST_VAR == "hello"
 
-            mock_django.conf.settings = mock_settings
+    def test_get_module_main_existing_in_sys_modules(self, in_memory_py: str):
+        """Test get_module caching behavior for __main__ modules."""
+        # First call loads the module
+        module1 = FunctionResolver.get_module("__main__", in_memory_py)
+        assert module1.TEST_VAR == "hello"
+
+        # Second call returns cached module (same identity)
+        module2 = FunctionResolver.get_module("__main__", in_memory_py)
+        assert module2 is module1
+
+    @pytest.mark.parametrize(
+        ("module_name", "source", "func_name", "expected"),
+        [
+            pytest.param("os", None, "getpid", os.getpid(), id="regular_module"),
+            pytest.param(
+                "__main__",
+                "def test_func():\n    return 'test'\n",
+                "test_func",
+                "test",
+                id="main_module",
+            ),
+        ],
+    )
+    def test_get_function_reference(
+        self,
+        make_py_file: Callable[[str], str],
+        module_name: str,
+        source: str | None,
+        func_name: str,
+        expected: Any,
+    ):
+        """Test get_function_reference resolves (and unwraps) functions from each module kind."""
+        func_file = make_py_file(source) if source is not None else None
+
+        func_ref = FunctionResolver.get_function_reference(module_name, func_name, func_file)
+
+        assert func_ref() == expected
+
+    def test_get_function_reference_without_wrapper(self, inject_main_module: Callable[..., str]):
+        """Test get_function_reference returns plain functions as-is."""
+
+        def plain_func() -> str:
+            return "plain"
+
+        main_file = inject_main_module(plain_func=plain_func)
+
+        func_ref = FunctionResolver.get_function_reference("__main__", "plain_func", main_file)
+
+        assert func_ref is plain_func
+
+    def test_get_function_reference_unwraps_task_wrapper(
+        self, inject_main_module: Callable[..., str]
+    ):
+        """Test get_function_reference returns the function behind ``__wrapped__``."""
+
+        def original() -> str:
+            return "original"
+
+        wrapper = types.SimpleNamespace(__wrapped__=original)
+        main_file = inject_main_module(wrapped_func=wrapper)
+
+        func_ref = FunctionResolver.get_function_reference("__main__", "wrapped_func", main_file)
+
+        assert func_ref is original
+
+    def test_get_class_reference_caches_by_path_and_file(self, monkeypatch: pytest.MonkeyPatch):
+        """Test get_class_reference resolves a class once and serves repeats from its cache."""
+        assert FunctionResolver.get_class_reference("pathlib.Path") is Path
+
+        def get_module(*args: Any) -> None:
+            pytest.fail("cache hit should not look the module up again")
+
+        monkeypatch.setattr(FunctionResolver, "get_module", get_module)
+        assert FunctionResolver.get_class_reference("pathlib.Path") is Path
+
+    def test_get_class_reference_missing_class(self):
+        """Test get_class_reference raises for a missing class and caches nothing."""
+        with pytest.raises(AttributeError, match="NoSuchClass"):
+            FunctionResolver.get_class_reference("pathlib.NoSuchClass")
+
+        assert FunctionResolver._class_cache == {}
+
+    @pytest.mark.parametrize("class_path", ["NoDotClass", ".LeadingDot"])
+    def test_get_class_reference_invalid_path(self, class_path: str):
+        """Test get_class_reference rejects paths not in "module.ClassName" format."""
+        with pytest.raises(ValueError, match="Invalid class path format"):
+            FunctionResolver.get_class_reference(class_path)
+
+    @pytest.mark.parametrize("main", [True, False], ids=["main", "regular"])
+    @pytest.mark.parametrize(
+        ("spec", "exc_type", "match"),
+        [
+            pytest.param(None, ImportError, "Failed to load spec", id="spec_none"),
+            pytest.param(
+                types.SimpleNamespace(loader=None),
+                ImportError,
+                "Failed to load spec",
+                id="loader_none",
+            ),
+            pytest.param(
+                fake_spec(ModuleNotFoundError("missing_module")),
+                ImportError,
+                "has missing dependencies",
+                id="exec_module_not_found",
+            ),
+            pytest.param(
+                fake_spec(RuntimeError("cannot be called from a running event loop")),
+                RuntimeError,
+                "cannot be called from a running event loop",
+                id="exec_runtime",
+            ),
+            pytest.param(
+                fake_spec(ValueError("some error")), ValueError, "some error", id="exec_general"
+            ),
+        ],
+    )
+    def test_get_module_load_errors(
+        self,
+        canonical_py: str,
+        main: bool,
+        spec: Any,
+        exc_type: type[Exception],
+        match: str,
+        stub_spec: Callable[[Any], None],
+    ):
+        """Test get_module surfaces spec/loader/exec failures for __main__ and file modules."""
+        stub_spec(spec)
+        # Nothing by the regular name is importable, so the resolver falls back to the file
+        module_name = "__main__" if main else f"not_importable_module_{_uniq()}"
+        with pytest.raises(exc_type, match=match):
+            FunctionResolver.get_module(module_name, module_file=canonical_py)
 
-            with patch.dict(
-                "sys.modules", {"django": mock_django, "django.conf": mock_django.conf}
-            ):
-                FunctionResolver.get_module("__main__", temp_file)
+    def test_get_module_regular_module_no_file_reraise_error(self):
+        """Test get_module with regular module when __import__ fails and no module_file provided."""
+        with pytest.raises(ModuleNotFoundError, match="No module named 'nonexistent_module'"):
+            FunctionResolver.get_module("nonexistent_module", module_file=None)
 
-                # Configure should be restored (we can't easily verify this in unit test
-                # but the code path is tested)
-        finally:
-            Path(temp_file).unlink()
+    def test_clear_cache(self):
+        """Test clear_cache method."""
+        # Add something to cache
+        FunctionResolver._module_cache["test"] = "value"
+        FunctionResolver._class_cache[("test.Task", None)] = object
 
-    def test_get_module_main_django_not_available(self):
-        """Test get_module works when Django is not imported."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("NO_DJANGO_VAR = 'no django'\n")
-            temp_file = f.name
+        FunctionResolver.clear_cache()
 
-        try:
-            # Ensure Django is not in sys.modules
-            django_modules = {k: v for k, v in sys.modules.items() if "django" in k.lower()}
-            for mod in django_modules:
-                del sys.modules[mod]
-
-            # Should work without Django
-            module = FunctionResolver.get_module("__main__", temp_file)
-            assert hasattr(module, "NO_DJANGO_VAR")
-        finally:
-            Path(temp_file).unlink()
+        assert len(FunctionResolver._module_cache) == 0
+        assert len(FunctionResolver._class_cache) == 0
 
-    def test_get_module_main_asyncio_run_at_module_level_error(self):
-        """Test get_module raises error for asyncio.run() at module level."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            # Write code that would trigger the error if executed
-            f.write("# This would cause error in real scenario\n")
-            temp_file = f.name
+    def test_get_module_main_with_django_patching(
+        self, canonical_py: str, fake_django: types.SimpleNamespace
+    ):
+        """Test get_module loads __main__ under the Django patch and restores configure."""
+        lazy_settings = type(fake_django.conf.settings)
+        original_configure = lazy_settings.configure
 
-        try:
-            # Mock the spec loader to raise the specific error
-            mock_spec = MagicMock()
-            mock_loader = MagicMock()
-            mock_loader.exec_module.side_effect = RuntimeError(
-                "cannot be called from a running event loop"
-            )
-            mock_spec.loader = mock_loader
-
-            with patch("importlib.util.spec_from_file_location", return_value=mock_spec):
-                with pytest.raises(
-                    RuntimeError, match="cannot be called from a running event loop"
-                ):
-                    FunctionResolver.get_module("__main__", temp_file)
-        finally:
-            Path(temp_file).unlink()
+        module = FunctionResolver.get_module("__main__", canonical_py)
 
-    def test_get_module_main_hash_consistency(self):
+        assert module.TEST_VAR == "hello"
+        assert lazy_settings.configure is original_configure
+
+    def test_get_module_main_django_not_available(
+        self, make_py_file: Callable[[str], str], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test get_module works when Django is not imported."""
+        temp_file = make_py_file("NO_DJANGO_VAR = 'no django'\n")
+
+        # Ensure Django is not in sys.modules (restored on teardown)
+        for mod in [k for k in sys.modules if "django" in k.lower()]:
+            monkeypatch.delitem(sys.modules, mod)
+
+        # Should work without Django
+        module = FunctionResolver.get_module("__main__", temp_file)
+        assert hasattr(module, "NO_DJANGO_VAR")
+
+    def test_get_module_main_hash_consistency(self, canonical_py: str):
         """Test that same file path generates same internal module name."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("HASH_TEST_VAR = 'hash test'\n")
-            temp_file = f.name
+        module1 = FunctionResolver.get_module("__main__", canonical_py)
+        # Drop only the module cache; the name cache still maps the path to its module
+        FunctionResolver._module_cache.clear()
+        module2 = FunctionResolver.get_module("__main__", canonical_py)
 
-        try:
-            # Load twice
-            module1 = FunctionResolver.get_module("__main__", temp_file)
-            FunctionResolver.clear_cache()  # Clear to force reload
-            module2 = FunctionResolver.get_module("__main__", temp_file)
-
-            # Should generate same module name (hence same behavior)
-            assert hasattr(module1, "HASH_TEST_VAR")
-            assert hasattr(module2, "HASH_TEST_VAR")
-        finally:
-            Path(temp_file).unlink()
+        assert hasattr(module1, "TEST_VAR")
+        assert module2 is module1
 
-    def test_get_function_reference_raises_attribute_error_for_missing_function(self):
+    def test_get_function_reference_raises_attribute_error_for_missing_function(
+        self, canonical_py: str
+    ):
         """Test get_function_reference raises AttributeError for missing function."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def existing_func():\n    pass\n")
-            temp_file = f.name
 
-        try:
-            with pytest.raises(AttributeError):
-                FunctionResolver.get_function_reference("__main__", "nonexistent_func", temp_file)
-        finally:
-            Path(temp_file).unlink()
+        with pytest.raises(AttributeError):
+            FunctionResolver.get_function_reference("__main__", "nonexistent_func", canonical_py)
 
-    def test_get_module_cleans_up_sys_modules_on_failure(self):
+    def test_get_module_cleans_up_sys_modules_on_failure(
+        self, canonical_py: str, stub_spec: Callable[[Any], None]
+    ):
         """Test that failed module loads clean up sys.modules."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("# Test file\n")
-            temp_file = f.name
+        # Mock exec_module to fail
+        mock_spec = fake_spec(ValueError("Load failed"))
 
-        try:
-            # Mock exec_module to fail
-            mock_spec = MagicMock()
-            mock_loader = MagicMock()
-            mock_loader.exec_module.side_effect = ValueError("Load failed")
-            mock_spec.loader = mock_loader
-
-            # Get the internal module name that would be created
-            import hashlib
-
-            cache_key = str(Path(temp_file).resolve())
-            path_hash = hashlib.sha256(cache_key.encode()).hexdigest()[:16]
-            internal_module_name = f"__asynctasq_main_{path_hash}__"
-
-            with patch("importlib.util.spec_from_file_location", return_value=mock_spec):
-                try:
-                    FunctionResolver.get_module("__main__", temp_file)
-                except ValueError:
-                    pass
-
-            # Module should be cleaned up from sys.modules
-            assert internal_module_name not in sys.modules
-        finally:
-            Path(temp_file).unlink()
+        stub_spec(mock_spec)
+        with pytest.raises(ValueError, match="Load failed"):
+            FunctionResolver.get_module("__main__", canonical_py)
 
-    def test_get_module_main_django_patch_import_error(self):
-        """Test Django patch handles ImportError gracefully."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("TEST_VAR = 'test'\n")
-            temp_file = f.name
+        # Module should be cleaned up from sys.modules
+        assert _internal_main_name(canonical_py) not in sys.modules
 
-        try:
-            # Skip Django patch test that interferes with Path operations
-            # The actual error handling is covered by test_get_module_main_django_not_available
-            module = FunctionResolver.get_module("__main__", temp_file)
-            assert hasattr(module, "TEST_VAR")
-        finally:
-            Path(temp_file).unlink()
-
-    def test_get_module_main_django_patch_attribute_error(self):
+    def test_get_module_main_django_patch_import_error(self, canonical_py: str):
+        """Test Django patch handles ImportError gracefully."""
+        # Skip Django patch test that interferes with Path operations
+        # The actual error handling is covered by test_get_module_main_django_not_available
+        module = FunctionResolver.get_module("__main__", canonical_py)
+        assert hasattr(module, "TEST_VAR")
+
+    def test_get_module_main_django_patch_attribute_error(
+        self, canonical_py: str, fake_django: types.SimpleNamespace
+    ):
         """Test Django patch handles AttributeError gracefully."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("TEST_VAR = 'test'\n")
-            temp_file = f.name
+        # django.conf without a settings attribute
+        del fake_django.conf.settings
 
-        try:
-            # Mock Django with missing attributes
-            mock_django = MagicMock()
-            del mock_django.conf.settings  # Remove settings attribute
-
-            with patch.dict(
-                "sys.modules", {"django": mock_django, "django.conf": mock_django.conf}
-            ):
-                # Should still load module without patching
-                module = FunctionResolver.get_module("__main__", temp_file)
-                assert hasattr(module, "TEST_VAR")
-        finally:
-            Path(temp_file).unlink()
+        # Should still load module without patching
+        module = FunctionResolver.get_module("__main__", canonical_py)
+        assert hasattr(module, "TEST_VAR")
 
-    def test_get_module_main_runtime_error_other_message(self):
+    def test_get_module_main_runtime_error_other_message(
+        self, canonical_py: str, stub_spec: Callable[[Any], None]
+    ):
         """Test RuntimeError with different message is cleaned up and re-raised."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("# Test file\n")
-            temp_file = f.name
+        mock_spec = fake_spec(RuntimeError("Some other runtime error"))
 
-        try:
-            mock_spec = MagicMock()
-            mock_loader = MagicMock()
-            mock_loader.exec_module.side_effect = RuntimeError("Some other runtime error")
-            mock_spec.loader = mock_loader
+        stub_spec(mock_spec)
+        with pytest.raises(RuntimeError, match="Some other runtime error"):
+            FunctionResolver.get_module("__main__", canonical_py)
 
-            import hashlib
+        # Verify cleanup
+        assert _internal_main_name(canonical_py) not in sys.modules
 
-            cache_key = str(Path(temp_file).resolve())
-            path_hash = hashlib.sha256(cache_key.encode()).hexdigest()[:16]
-            internal_module_name = f"__asynctasq_main_{path_hash}__"
+    def test_get_module_main_django_restoration_on_exception(
+        self,
+        canonical_py: str,
+        fake_django: types.SimpleNamespace,
+        stub_spec: Callable[[Any], None],
+    ):
+        """Test Django patch restoration happens even when exception occurs."""
+        lazy_settings = type(fake_django.conf.settings)
+        original_configure = lazy_settings.configure
 
-            with patch("importlib.util.spec_from_file_location", return_value=mock_spec):
-                with pytest.raises(RuntimeError, match="Some other runtime error"):
-                    FunctionResolver.get_module("__main__", temp_file)
+        # Mock exec_module to fail
+        mock_spec = fake_spec(ValueError("Execution failed"))
 
-            # Verify cleanup
-            assert internal_module_name not in sys.modules
-        finally:
-            Path(temp_file).unlink()
+        stub_spec(mock_spec)
+        with pytest.raises(ValueError, match="Execution failed"):
+            FunctionResolver.get_module("__main__", canonical_py)
 
-    def test_get_module_main_django_restoration_on_exception(self):
-        """Test Django patch restoration happens even when exception occurs."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("# Test file\n")
-            temp_file = f.name
-
-        try:
-            # Setup Django mock
-            mock_django = MagicMock()
-            mock_settings = MagicMock()
-            original_configure = MagicMock()
-            LazySettings = MagicMock
-            LazySettings.configure = original_configure
-
-            mock_django.conf.settings = mock_settings
-
-            # Mock exec_module to fail
-            mock_spec = MagicMock()
-            mock_loader = MagicMock()
-            mock_loader.exec_module.side_effect = ValueError("Execution failed")
-            mock_spec.loader = mock_loader
-
-            with (
-                patch.dict("sys.modules", {"django": mock_django, "django.conf": mock_django.conf}),
-                patch("importlib.util.spec_from_file_location", return_value=mock_spec),
-            ):
-                try:
-                    FunctionResolver.get_module("__main__", temp_file)
-                except ValueError:
-                    pass
-
-            # Should still work (restoration happens in finally)
-        finally:
-            Path(temp_file).unlink()
+        # Restoration happens in the loader's finally block
+        assert lazy_settings.configure is original_configure
 
     def test_get_module_regular_from_file_nonexistent(self):
         """Test get_module with non-existent file for regular module."""
@@ -654,73 +504,47 @@ class TestFunctionResolver:
         with pytest.raises((FileNotFoundError, ImportError)):
             FunctionResolver.get_module("some_module", module_file=nonexistent_file)
 
-    def test_get_module_regular_module_success_path(self):
-        """Test get_module with standard library module (success path)."""
-        import json
-
-        module = FunctionResolver.get_module("json")
-        assert module is json
-
-    def test_module_cache_key_uses_absolute_path(self):
+    def test_module_cache_key_uses_absolute_path(self, in_memory_py: str):
         """Test that module cache uses absolute paths as keys."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("CACHE_KEY_VAR = 'cache key test'\n")
-            temp_file = f.name
+        # Load module
+        module = FunctionResolver.get_module("__main__", in_memory_py)
 
-        try:
-            # Load module
-            module = FunctionResolver.get_module("__main__", temp_file)
+        # Check cache uses absolute path
+        abs_path = _resolved(in_memory_py)
+        assert abs_path in FunctionResolver._module_cache
+        assert FunctionResolver._module_cache[abs_path] is module
 
-            # Check cache uses absolute path
-            abs_path = str(Path(temp_file).resolve())
-            assert abs_path in FunctionResolver._module_cache
-            assert FunctionResolver._module_cache[abs_path] is module
-        finally:
-            Path(temp_file).unlink()
-            FunctionResolver.clear_cache()
-
-    def test_get_module_main_uses_name_cache_with_sys_modules(self):
+    def test_get_module_main_uses_name_cache_with_sys_modules(
+        self, canonical_py: str, monkeypatch: pytest.MonkeyPatch
+    ):
         """Test __main__ module lookup uses name cache with sys.modules fallback."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("NAME_CACHE_VAR = 'from name cache'\n")
-            temp_file = f.name
-
-        try:
-            abs_path = str(Path(temp_file).resolve())
-            # Pre-populate name_cache but not module_cache
-            internal_name = "__asynctasq_main_test__"
-            FunctionResolver._name_cache[abs_path] = internal_name
-
-            # Create a fake module in sys.modules
-            import types
-
-            fake_module = types.ModuleType(internal_name)
-            fake_module.NAME_CACHE_VAR = "from sys.modules"  # type: ignore
-            sys.modules[internal_name] = fake_module
-
-            # Should find module via name_cache -> sys.modules
-            module = FunctionResolver.get_module("__main__", temp_file)
-            assert module is fake_module
-            assert module.NAME_CACHE_VAR == "from sys.modules"  # type: ignore
 
-            # Cleanup
-            sys.modules.pop(internal_name, None)
-        finally:
-            Path(temp_file).unlink()
-            FunctionResolver.clear_cache()
-
-    def test_get_regular_module_loads_from_file_when_not_importable(self):
+        abs_path = _resolved(canonical_py)
+        # Pre-populate name_cache but not module_cache
+        internal_name = "__asynctasq_main_test__"
+        FunctionResolver._name_cache[abs_path] = internal_name
+
+        # Create a fake module in sys.modules
+        fake_module = types.ModuleType(internal_name)
+        fake_module.NAME_CACHE_VAR = "from sys.modules"  # type: ignore
+        monkeypatch.setitem(sys.modules, internal_name, fake_module)
+
+        # Should find module via name_cache -> sys.modules without building a spec
+        monkeypatch.setattr(importlib.util, "spec_from_file_location", _spec_must_not_be_built)
+        module = FunctionResolver.get_module("__main__", canonical_py)
+        assert module is fake_module
+        assert module.NAME_CACHE_VAR == "from sys.modules"  # type: ignore
+
+    def test_get_regular_module_loads_from_file_when_not_importable(
+        self, make_py_file: Callable[[str], str]
+    ):
         """Test regular module loads from file when not in sys path."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("SYS_MODULE_VAR = 'loaded_from_file'\n")
-            temp_file = f.name
+        temp_file = make_py_file("SYS_MODULE_VAR = 'loaded_from_file'\n")
 
         # Use a name that won't be importable via __import__
-        unique_suffix = f"{id(temp_file)}_{hash(temp_file)}"
-        module_name = f"impossible_to_import_module_{unique_suffix}"
+        module_name = f"impossible_to_import_module_{_uniq()}"
         try:
-            abs_path = str(Path(temp_file).resolve())
-            FunctionResolver.clear_cache()
+            abs_path = _resolved(temp_file)
 
             # Should load module from file since __import__ will fail
             module = FunctionResolver.get_module(module_name, temp_file)
@@ -733,34 +557,20 @@ class TestFunctionResolver:
             assert abs_path in FunctionResolver._module_cache
         finally:
             sys.modules.pop(module_name, None)
-            Path(temp_file).unlink()
-            FunctionResolver.clear_cache()
 
-    def test_django_patched_configure_reraises_other_runtime_errors(self):
+    @pytest.mark.usefixtures("fake_django")
+    def test_django_patched_configure_reraises_other_runtime_errors(self, canonical_py: str):
         """Test Django patched_configure re-raises non-settings errors."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("# Test file\n")
-            temp_file = f.name
+        # We need to test the patched configure re-raises
+        # The actual patching happens inside _patch_django_if_needed
+        # The patch installs a wrapper that should re-raise non-settings errors
+        # We can't easily test the actual configure call, but we ensure the path runs
+        module = FunctionResolver.get_module("__main__", canonical_py)
+        assert module is not None
 
-        try:
-            # Mock Django
-            mock_django = MagicMock()
-            mock_settings = MagicMock()
-
-            mock_django.conf.settings = mock_settings
-
-            # We need to test the patched configure re-raises
-            # The actual patching happens inside _patch_django_if_needed
-            with patch.dict(
-                "sys.modules", {"django": mock_django, "django.conf": mock_django.conf}
-            ):
-                # The patch installs a wrapper that should re-raise non-settings errors
-                # We can't easily test the actual configure call, but we ensure the path runs
-                module = FunctionResolver.get_module("__main__", temp_file)
-                assert module is not None
-        finally:
-            Path(temp_file).unlink()
-            FunctionResolver.clear_cache()
+
+class TestDjangoPatchHelpers:
+    """Test the Django patch/restore helpers, which never touch the resolver caches."""
 
     def test_restore_django_handles_attribute_error(self):
         """Test _restore_django handles AttributeError gracefully."""
@@ -770,35 +580,20 @@ class TestFunctionResolver:
         # Should not raise
         FunctionResolver._restore_django(invalid_state)
 
-    def test_patch_django_returns_none_when_import_fails(self):
+    def test_patch_django_returns_none_when_import_fails(self, monkeypatch: pytest.MonkeyPatch):
         """Test _patch_django_if_needed returns None on ImportError."""
-        # Mock django.conf in sys.modules but make import fail
-        mock_django = MagicMock()
-
-        # Make import django.conf raise ImportError
-        def mock_import(name, *args, **kwargs):
-            if name == "django.conf":
-                raise ImportError("No module named 'django.conf'")
-            return MagicMock()
-
-        with (
-            patch.dict("sys.modules", {"django.conf": mock_django}),
-            patch("builtins.__import__", side_effect=mock_import),
-        ):
-            actual = FunctionResolver._patch_django_if_needed(Path("/fake/path.py"))
-            # Should return None due to ImportError
-            # Note: This is hard to test because the actual import happens at module load
-            # The test verifies the code path exists
-            assert actual is None or actual is not None  # Path coverage
+        # A None entry makes `import django.conf` raise ImportError while still
+        # satisfying the "django.conf" in sys.modules check
+        monkeypatch.setitem(sys.modules, "django", None)
+        monkeypatch.setitem(sys.modules, "django.conf", None)
 
-    def test_patch_django_returns_none_when_attribute_error(self):
+        assert FunctionResolver._patch_django_if_needed(Path("/fake/path.py")) is None
+
+    def test_patch_django_returns_none_when_attribute_error(self, monkeypatch: pytest.MonkeyPatch):
         """Test _patch_django_if_needed returns None on AttributeError."""
-        # Mock django.conf with missing settings attribute
-        mock_django_conf = MagicMock()
-        del mock_django_conf.settings  # Remove settings attribute
-
-        with patch.dict("sys.modules", {"django.conf": mock_django_conf}):
-            # The AttributeError should be caught
-            actual = FunctionResolver._patch_django_if_needed(Path("/fake/path.py"))
-            # Should return None (settings attribute missing)
-            assert actual is None or actual is not None  # Path coverage
+        # django.conf without a settings attribute
+        conf = types.SimpleNamespace()
+        monkeypatch.setitem(sys.modules, "django", types.SimpleNamespace(conf=conf))
+        monkeypatch.setitem(sys.modules, "django.conf", conf)
+
+        assert FunctionResolver._patch_django_if_needed(Path("/fake/path.py")) is None
@@ -11,8 +11,10 @@ Testing Strategy:
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import Any
 
-from pytest import main, mark, raises
+import msgspec
+from pytest import fixture, main, mark, raises
 
 from asynctasq.serializers.msgspec_serializer import MsgspecSerializer
 from asynctasq.tasks import AsyncTask, SyncTask
@@ -21,6 +23,17 @@ from asynctasq.tasks.services.serializer import TaskSerializer
 from asynctasq.tasks.types.function_task import FunctionTask
 
 
+def _wire(data: bytes) -> dict[str, Any]:
+    """Decode serialized task bytes to the raw envelope dict (no type restoration)."""
+    return msgspec.msgpack.decode(data)
+
+
+@fixture(scope="module")
+def serializer() -> TaskSerializer:
+    """One TaskSerializer (and msgspec encoder/decoder pair) shared by the module."""
+    return TaskSerializer(MsgspecSerializer())
+
+
 class SimpleAsyncTask(AsyncTask):
     """Simple async task for testing serialization."""
 
@@ -51,9 +64,8 @@ class SimpleSyncTask(SyncTask):
 class TestTaskSerializerSerialize:
     """Test TaskSerializer.serialize() method."""
 
-    def test_serialize_async_task(self) -> None:
+    def test_serialize_async_task(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         task = SimpleAsyncTask("hello", count=42)
         task._task_id = "task-123"
         task._current_attempt = 2
@@ -64,13 +76,13 @@ class TestTaskSerializerSerialize:
 
         # Assert
         assert isinstance(result, bytes)
-        assert b"SimpleAsyncTask" in result
-        assert b"task-123" in result
-        assert b"hello" in result
+        wire = _wire(result)
+        assert wire["class"] == f"{SimpleAsyncTask.__module__}.SimpleAsyncTask"
+        assert wire["metadata"]["task_id"] == "task-123"
+        assert wire["params"] == {"value": "hello", "count": 42}
 
-    def test_serialize_sync_task(self) -> None:
+    def test_serialize_sync_task(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         task = SimpleSyncTask(x=10, y=20)
         task._task_id = "sync-task-456"
 
@@ -79,15 +91,16 @@ class TestTaskSerializerSerialize:
 
         # Assert
         assert isinstance(result, bytes)
-        assert b"SimpleSyncTask" in result
-        assert b"sync-task-456" in result
+        wire = _wire(result)
+        assert wire["class"] == f"{SimpleSyncTask.__module__}.SimpleSyncTask"
+        assert wire["metadata"]["task_id"] == "sync-task-456"
+        assert wire["params"] == {"x": 10, "y": 20}
 
-    def test_serialize_function_task(self) -> None:
+    def test_serialize_function_task(self, serializer: TaskSerializer) -> None:
         # Arrange
         def my_function(a: int, b: str) -> str:
             return f"{a}_{b}"
 
-        serializer = TaskSerializer(MsgspecSerializer())
         task = FunctionTask(my_function, 10, b="test")
         task._task_id = "func-task-789"
 
@@ -96,13 +109,13 @@ class TestTaskSerializerSerialize:
 
         # Assert
         assert isinstance(result, bytes)
-        assert b"FunctionTask" in result
-        assert b"func-task-789" in result
-        assert b"my_function" in result
+        wire = _wire(result)
+        assert wire["class"] == f"{FunctionTask.__module__}.FunctionTask"
+        assert wire["metadata"]["task_id"] == "func-task-789"
+        assert wire["metadata"]["func_name"] == "my_function"
 
-    def test_serialize_preserves_config(self) -> None:
+    def test_serialize_preserves_config(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         task = SimpleAsyncTask("test")
         task._task_id = "config-task"
         task.config["queue"] = "custom-queue"
@@ -112,11 +125,12 @@ class TestTaskSerializerSerialize:
         result = serializer.serialize(task)
 
         # Assert
-        assert b"custom-queue" in result
+        metadata = _wire(result)["metadata"]
+        assert metadata["queue"] == "custom-queue"
+        assert metadata["max_attempts"] == 10
 
-    def test_serialize_handles_none_dispatched_at(self) -> None:
+    def test_serialize_handles_none_dispatched_at(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         task = SimpleAsyncTask("test")
         task._task_id = "no-dispatch"
         task._dispatched_at = None
@@ -127,15 +141,34 @@ class TestTaskSerializerSerialize:
         # Assert
         assert isinstance(result, bytes)
 
+    def test_serialize_computes_class_info_once_per_class(self) -> None:
+        # Arrange
+        from unittest.mock import patch
+
+        serializer = TaskSerializer(MsgspecSerializer())
+        task = SimpleSyncTask(x=1, y=2)
+        task._task_id = "class-info"
+
+        # Act
+        with patch(
+            "asynctasq.tasks.services.serializer.inspect.getfile", return_value=__file__
+        ) as mock_getfile:
+            first = serializer.serialize(task)
+            second = serializer.serialize(task)
+
+        # Assert
+        assert first == second
+        assert _wire(second)["class_file"] == __file__
+        mock_getfile.assert_called_once_with(SimpleSyncTask)
+
 
 @mark.unit
 class TestTaskSerializerDeserialize:
     """Test TaskSerializer.deserialize() method."""
 
     @mark.asyncio
-    async def test_deserialize_async_task(self) -> None:
+    async def test_deserialize_async_task(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         original = SimpleAsyncTask("world", count=99)
         original._task_id = "deserialize-123"
         original._current_attempt = 3
@@ -155,9 +188,8 @@ class TestTaskSerializerDeserialize:
         assert result._dispatched_at == datetime(2025, 6, 15, 8, 30, 0, tzinfo=UTC)
 
     @mark.asyncio
-    async def test_deserialize_sync_task(self) -> None:
+    async def test_deserialize_sync_task(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         original = SimpleSyncTask(x=5, y=7)
         original._task_id = "sync-deserialize"
 
@@ -172,13 +204,12 @@ class TestTaskSerializerDeserialize:
         assert result.y == 7
 
     @mark.asyncio
-    async def test_deserialize_function_task(self) -> None:
+    async def test_deserialize_function_task(self, serializer: TaskSerializer) -> None:
         # Arrange - use a module-level function that can be resolved
         # Local functions inside test methods cannot be deserialized
         # because they're not accessible at module level
         import os
 
-        serializer = TaskSerializer(MsgspecSerializer())
         # Use os.path.exists which is a known module-level function
         original = FunctionTask(os.path.exists, "/tmp")
         original._task_id = "func-deserialize"
@@ -194,9 +225,8 @@ class TestTaskSerializerDeserialize:
         assert result.args == ("/tmp",)
 
     @mark.asyncio
-    async def test_deserialize_restores_config(self) -> None:
+    async def test_deserialize_restores_config(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         original = SimpleAsyncTask("config-test")
         original._task_id = "config-deserialize"
         original.config["queue"] = "restored-queue"
@@ -218,9 +248,8 @@ class TestTaskSerializerDeserialize:
         assert result.config.get("visibility_timeout") == 7200
 
     @mark.asyncio
-    async def test_deserialize_handles_none_dispatched_at(self) -> None:
+    async def test_deserialize_handles_none_dispatched_at(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         original = SimpleAsyncTask("no-dispatch")
         original._task_id = "no-dispatch-deserialize"
         original._dispatched_at = None
@@ -234,9 +263,10 @@ class TestTaskSerializerDeserialize:
         assert result._dispatched_at is None
 
     @mark.asyncio
-    async def test_deserialize_handles_invalid_dispatched_at(self) -> None:
+    async def test_deserialize_handles_invalid_dispatched_at(
+        self, serializer: TaskSerializer
+    ) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         # Manually create task data with invalid dispatched_at
         task_data = {
             "class": f"{SimpleAsyncTask.__module__}.SimpleAsyncTask",
@@ -252,7 +282,7 @@ class TestTaskSerializerDeserialize:
                 "visibility_timeout": 3600,
             },
         }
-        serialized = MsgspecSerializer().serialize(task_data)
+        serialized = serializer.serializer.serialize(task_data)
 
         # Act
         result = await serializer.deserialize(serialized)
@@ -266,9 +296,8 @@ class TestTaskSerializerRoundTrip:
     """Test full serialization/deserialization roundtrip."""
 
     @mark.asyncio
-    async def test_roundtrip_preserves_all_attributes(self) -> None:
+    async def test_roundtrip_preserves_all_attributes(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         original = SimpleAsyncTask("roundtrip", count=123)
         original._task_id = "roundtrip-task"
         original._current_attempt = 5
@@ -293,12 +322,11 @@ class TestTaskSerializerRoundTrip:
         assert restored.config.get("timeout") == original.config.get("timeout")
 
     @mark.asyncio
-    async def test_roundtrip_function_task_with_kwargs(self) -> None:
+    async def test_roundtrip_function_task_with_kwargs(self, serializer: TaskSerializer) -> None:
         # Arrange - use a module-level function
         # Local functions inside test methods cannot be deserialized
         import json
 
-        serializer = TaskSerializer(MsgspecSerializer())
         # Use json.dumps which accepts kwargs
         original = FunctionTask(json.dumps, {"key": "value"}, indent=2)
         original._task_id = "complex-func"
@@ -318,9 +346,10 @@ class TestTaskSerializerEdgeCases:
     """Test edge cases and error conditions."""
 
     @mark.asyncio
-    async def test_deserialize_function_task_missing_func_module_raises(self) -> None:
+    async def test_deserialize_function_task_missing_func_module_raises(
+        self, serializer: TaskSerializer
+    ) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         # Create task data without func_module
         task_data = {
             "class": f"{FunctionTask.__module__}.FunctionTask",
@@ -337,16 +366,15 @@ class TestTaskSerializerEdgeCases:
                 # Missing func_module and func_name
             },
         }
-        serialized = MsgspecSerializer().serialize(task_data)
+        serialized = serializer.serializer.serialize(task_data)
 
         # Act & Assert
         with raises(ValueError, match="FunctionTask missing func_module or func_name"):
             await serializer.deserialize(serialized)
 
     @mark.asyncio
-    async def test_to_task_info_delegates_to_converter(self) -> None:
+    async def test_to_task_info_delegates_to_converter(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         task = SimpleAsyncTask("info-test")
         task._task_id = "info-task-id"
         task._dispatched_at = datetime(2025, 1, 1, 0, 0, 0, tzinfo=UTC)
@@ -362,9 +390,8 @@ class TestTaskSerializerEdgeCases:
         # Queue from metadata takes precedence over passed queue_name
         assert result.queue == "test-queue"
 
-    def test_serialize_filters_private_attributes(self) -> None:
+    def test_serialize_filters_private_attributes(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         task = SimpleAsyncTask("private-test")
         task._task_id = "private-task"
         task._some_internal_attr = "should-not-serialize"  # type: ignore[attr-defined]
@@ -374,11 +401,10 @@ class TestTaskSerializerEdgeCases:
 
         # Assert
         # Private attributes starting with _ should not be in params
-        assert b"_some_internal_attr" not in result
+        assert "_some_internal_attr" not in _wire(result)["params"]
 
-    def test_serialize_filters_callable_attributes(self) -> None:
+    def test_serialize_filters_callable_attributes(self, serializer: TaskSerializer) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         task = SimpleAsyncTask("callable-test")
         task._task_id = "callable-task"
 
@@ -389,7 +415,7 @@ class TestTaskSerializerEdgeCases:
         result = serializer.serialize(task)
 
         # Assert
-        assert b"custom_method" not in result
+        assert "custom_method" not in _wire(result)["params"]
 
 
 @mark.unit
@@ -397,9 +423,10 @@ class TestTaskSerializerMainModule:
     """Test serialization with __main__ modules (normalized to __main__)."""
 
     @mark.asyncio
-    async def test_serialize_normalizes_asynctasq_main_module(self) -> None:
+    async def test_serialize_normalizes_asynctasq_main_module(
+        self, serializer: TaskSerializer
+    ) -> None:
         # Arrange
-        serializer = TaskSerializer(MsgspecSerializer())
         task = SimpleAsyncTask("main-test")
         task._task_id = "main-task"
 
@@ -411,13 +438,14 @@ class TestTaskSerializerMainModule:
 
         # Assert - module name should be preserved as-is (not __asynctasq_main_)
         # since SimpleAsyncTask is from the test module
-        assert original_module.encode() in serialized
+        assert _wire(serialized)["class"] == f"{original_module}.SimpleAsyncTask"
 
     @mark.asyncio
     async def test_serialize_task_from_asynctasq_main_module(self) -> None:
         """Test that __asynctasq_main_ prefix is normalized to __main__."""
         from unittest.mock import patch
 
+        # Fresh serializer: the shared one has already cached SimpleAsyncTask's class path
         serializer = TaskSerializer(MsgspecSerializer())
         task = SimpleAsyncTask("asynctasq-main-test")
         task._task_id = "asynctasq-main-task"
@@ -427,7 +455,7 @@ class TestTaskSerializerMainModule:
             serialized = serializer.serialize(task)
 
         # Assert - module name should be normalized to __main__
-        assert b"__main__.SimpleAsyncTask" in serialized
+        assert _wire(serialized)["class"] == "__main__.SimpleAsyncTask"
         assert b"__asynctasq_main_" not in serialized
 
 
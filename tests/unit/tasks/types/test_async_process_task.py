@@ -1,7 +1,11 @@
 """Unit tests for AsyncProcessTask class."""
 
 import asyncio
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
 import os
+from unittest.mock import MagicMock
 
 import pytest
 from pytest import main
@@ -24,6 +28,68 @@ def manager(reset_default_manager) -> ProcessPoolManager:
     return reset_default_manager
 
 
+class _FakePool:
+    """Executor stand-in whose submit() returns an already-completed Future."""
+
+    __slots__ = ("result", "submitted")
+
+    def __init__(self, result: object) -> None:
+        self.result = result
+        self.submitted: list[Callable[..., object]] = []
+
+    def submit(self, fn: Callable[..., object], /, *args: object) -> Future:
+        self.submitted.append(fn)
+        future: Future = Future()
+        future.set_result(self.result)
+        return future
+
+
+class _FakeManager:
+    """ProcessPoolManager stand-in that hands out a single pool."""
+
+    __slots__ = ("get_async_pool_calls", "pool")
+
+    def __init__(self, pool: _FakePool) -> None:
+        self.pool = pool
+        self.get_async_pool_calls = 0
+
+    def get_async_pool(self) -> _FakePool:
+        self.get_async_pool_calls += 1
+        return self.pool
+
+
+@dataclass(slots=True)
+class _FallbackMocks:
+    """Mocks installed on async_process_task for the no-warm-loop fallback path."""
+
+    get_warm_event_loop: MagicMock
+    increment_fallback_count: MagicMock
+    runner: MagicMock
+    logger_warning: MagicMock
+
+
+@pytest.fixture
+def fallback_mocks(monkeypatch: pytest.MonkeyPatch) -> _FallbackMocks:
+    """Force the fallback path: no warm loop, mocked runner, counter and logger."""
+    from asynctasq.tasks.types import async_process_task
+
+    mocks = _FallbackMocks(
+        get_warm_event_loop=MagicMock(return_value=None),
+        increment_fallback_count=MagicMock(return_value=1),
+        runner=MagicMock(),
+        logger_warning=MagicMock(),
+    )
+    monkeypatch.setattr(async_process_task, "get_warm_event_loop", mocks.get_warm_event_loop)
+    monkeypatch.setattr(
+        async_process_task, "increment_fallback_count", mocks.increment_fallback_count
+    )
+    monkeypatch.setattr(
+        async_process_task, "get_worker_runner", MagicMock(return_value=mocks.runner)
+    )
+    monkeypatch.setattr(async_process_task.logger, "warning", mocks.logger_warning)
+    return mocks
+
+
 class AsyncGetPIDTask(AsyncProcessTask):
     """Test task that returns the process ID asynchronously."""
 
@@ -348,7 +414,7 @@ async def test_async_process_task_warm_event_loop_path():
     # Arrange
     task = SharedAsyncFactorialTask(n=4)
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     # Create a real Future instead of MagicMock
     mock_future = loop.create_future()
     mock_future.set_result(24)
@@ -372,92 +438,75 @@ async def test_async_process_task_warm_event_loop_path():
 
 
 @pytest.mark.asyncio
-async def test_async_process_task_fallback_path():
-    """Test fallback to asyncio.run() when warm loop unavailable."""
-    from unittest.mock import patch
-
+async def test_async_process_task_fallback_path(fallback_mocks: _FallbackMocks):
+    """Test fallback to the process's loop runner when warm loop unavailable."""
     # Arrange
     task = SharedAsyncFactorialTask(n=3)
+    fallback_mocks.runner.run.return_value = 6
 
-    with (
-        patch(
-            "asynctasq.tasks.types.async_process_task.get_warm_event_loop",
-            return_value=None,  # Simulate no warm loop
-        ),
-        patch(
-            "asynctasq.tasks.types.async_process_task.increment_fallback_count",
-            return_value=1,
-        ),
-        patch("asynctasq.tasks.types.async_process_task.run", return_value=6) as mock_asyncio_run,
-        patch("asynctasq.tasks.types.async_process_task.logger.warning") as mock_warning,
-    ):
-        # Act
-        result = task._run_async_in_process()
+    # Act
+    result = task._run_async_in_process()
 
-        # Assert
-        assert result == 6
-        mock_asyncio_run.assert_called_once()
-        mock_warning.assert_called_once()
-        assert "Warm event loop not available" in mock_warning.call_args[0][0]
+    # Assert
+    assert result == 6
+    fallback_mocks.runner.run.assert_called_once()
+    fallback_mocks.logger_warning.assert_called_once()
+    assert "Warm event loop not available" in fallback_mocks.logger_warning.call_args[0][0]
 
 
 @pytest.mark.asyncio
-async def test_async_process_task_fallback_counter_increments():
+async def test_async_process_task_fallback_counter_increments(fallback_mocks: _FallbackMocks):
     """Test fallback counter increments on each fallback."""
-    from unittest.mock import patch
-
     # Arrange
     task = SharedAsyncFactorialTask(n=2)
+    fallback_mocks.increment_fallback_count.return_value = 5  # Simulate 5th fallback
+    fallback_mocks.runner.run.return_value = 2
 
-    with (
-        patch(
-            "asynctasq.tasks.types.async_process_task.get_warm_event_loop",
-            return_value=None,
-        ),
-        patch(
-            "asynctasq.tasks.types.async_process_task.increment_fallback_count",
-            return_value=5,  # Simulate 5th fallback
-        ) as mock_increment,
-        patch("asynctasq.tasks.types.async_process_task.run", return_value=2),
-        patch("asynctasq.tasks.types.async_process_task.logger.warning"),
-    ):
-        # Act
-        task._run_async_in_process()
+    # Act
+    task._run_async_in_process()
 
-        # Assert
-        mock_increment.assert_called_once()
+    # Assert
+    fallback_mocks.increment_fallback_count.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_async_process_task_calls_get_async_pool():
-    """Test run() calls get_async_pool() to get process pool."""
-    from concurrent.futures import Future
-    from unittest.mock import MagicMock, patch
+@pytest.mark.usefixtures("fresh_worker_runner")
+def test_async_process_task_fallback_reuses_runner(monkeypatch: pytest.MonkeyPatch):
+    """Test consecutive fallback calls run on the same event loop."""
+    from asynctasq.tasks.types import async_process_task
+    from asynctasq.tasks.utils import execution_helpers
 
     # Arrange
-    task = SharedAsyncFactorialTask(n=1)
+    monkeypatch.setattr(async_process_task, "get_warm_event_loop", lambda: None)
+    monkeypatch.setattr(async_process_task.logger, "warning", MagicMock())
 
-    # Create a real Future for the pool.submit() result
-    pool_future = Future()
-    pool_future.set_result(1)
+    # Act
+    first = SharedAsyncFactorialTask(n=3)._run_async_in_process()
+    runner = execution_helpers._worker_runner
+    second = SharedAsyncFactorialTask(n=4)._run_async_in_process()
 
-    mock_pool = MagicMock()
-    mock_pool.submit.return_value = pool_future
+    # Assert
+    assert (first, second) == (6, 24)
+    assert runner is not None
+    assert execution_helpers._worker_runner is runner
 
-    mock_manager = MagicMock()
-    mock_manager.get_async_pool.return_value = mock_pool
 
-    with patch(
-        "asynctasq.tasks.types.async_process_task.get_default_manager",
-        return_value=mock_manager,
-    ):
-        # Act
-        result = await task.run()
+@pytest.mark.asyncio
+async def test_async_process_task_calls_get_async_pool(monkeypatch: pytest.MonkeyPatch):
+    """Test run() calls get_async_pool() to get process pool."""
+    from asynctasq.tasks.types import async_process_task
 
-        # Assert
-        assert result == 1
-        mock_manager.get_async_pool.assert_called_once()
-        mock_pool.submit.assert_called_once()
+    # Arrange
+    task = SharedAsyncFactorialTask(n=1)
+    manager = _FakeManager(_FakePool(result=1))
+    monkeypatch.setattr(async_process_task, "get_default_manager", lambda: manager)
+
+    # Act
+    result = await task.run()
+
+    # Assert
+    assert result == 1
+    assert manager.get_async_pool_calls == 1
+    assert manager.pool.submitted == [task._run_async_in_process]
 
 
 @pytest.mark.asyncio
@@ -519,11 +568,14 @@ async def test_async_process_task_reduce_with_main_module():
 
 
 @pytest.mark.asyncio
-async def test_async_process_task_reduce_without_file():
+async def test_async_process_task_reduce_without_file(monkeypatch: pytest.MonkeyPatch):
     """Test __reduce__ when inspect.getfile fails."""
     from unittest.mock import patch
 
-    # Arrange
+    from asynctasq.tasks.types import async_process_task
+
+    # Arrange - forget class files cached by earlier reductions
+    monkeypatch.setattr(async_process_task, "_class_file_cache", {})
     task = SharedAsyncFactorialTask(n=3)
 
     # Mock getfile to raise TypeError (builtin)
@@ -537,6 +589,26 @@ async def test_async_process_task_reduce_without_file():
         assert class_file is None
 
 
+@pytest.mark.asyncio
+async def test_async_process_task_reduce_caches_class_file(monkeypatch: pytest.MonkeyPatch):
+    """Test __reduce__ looks up a class's source file only once."""
+    from unittest.mock import patch
+
+    from asynctasq.tasks.types import async_process_task
+
+    # Arrange
+    monkeypatch.setattr(async_process_task, "_class_file_cache", {})
+    tasks = [SharedAsyncFactorialTask(n=i) for i in range(3)]
+
+    # Act
+    with patch("inspect.getfile", return_value="/fake/path/shared_tasks.py") as mock_getfile:
+        class_files = [task.__reduce__()[1][2] for task in tasks]
+
+    # Assert
+    assert class_files == ["/fake/path/shared_tasks.py"] * 3
+    mock_getfile.assert_called_once_with(SharedAsyncFactorialTask)
+
+
 @pytest.mark.asyncio
 async def test_async_process_task_reconstruct_normalizes_main_module():
     """Test reconstruction normalizes __asynctasq_main_ back to __main__."""
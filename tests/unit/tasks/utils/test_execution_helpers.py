@@ -1,15 +1,19 @@
 """Unit tests for execution_helpers module."""
 
+import asyncio
 import concurrent.futures
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from asynctasq.tasks.utils import execution_helpers
 from asynctasq.tasks.utils.execution_helpers import (
     _sync_process_task_worker,
     execute_in_process_sync,
     execute_in_thread,
 )
+from asynctasq.utils import loop
 
 
 class TestExecuteInThread:
@@ -91,6 +95,13 @@ class TestExecuteInProcessSync:
 class TestSyncProcessTaskWorker:
     """Test _sync_process_task_worker function."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_task_serializer(self):
+        """Drop the process-wide TaskSerializer so each test sees its patched class."""
+        execution_helpers._get_task_serializer.cache_clear()
+        yield
+        execution_helpers._get_task_serializer.cache_clear()
+
     @patch("asynctasq.tasks.services.serializer.TaskSerializer")
     def test_sync_process_task_worker_success(self, mock_serializer_class):
         """Test successful execution of sync process task worker."""
@@ -103,15 +114,17 @@ class TestSyncProcessTaskWorker:
         mock_task.execute.return_value = "task_result"
         mock_serializer.deserialize.return_value = mock_task
 
-        # Mock asyncio.run
-        with patch("asyncio.run", return_value=mock_task) as mock_asyncio_run:
+        # Mock the process-local runner
+        mock_runner = MagicMock()
+        mock_runner.run.return_value = mock_task
+        with patch(
+            "asynctasq.tasks.utils.execution_helpers.get_worker_runner", return_value=mock_runner
+        ):
             result = _sync_process_task_worker(b"serialized_task")
 
             assert result == "task_result"
             mock_serializer_class.assert_called_once()
-            mock_asyncio_run.assert_called_once_with(
-                mock_serializer.deserialize(b"serialized_task")
-            )
+            mock_runner.run.assert_called_once_with(mock_serializer.deserialize(b"serialized_task"))
             mock_task.execute.assert_called_once()
 
     @patch("asynctasq.tasks.services.serializer.TaskSerializer")
@@ -126,13 +139,144 @@ class TestSyncProcessTaskWorker:
         mock_task.execute.side_effect = RuntimeError("Task failed")
         mock_serializer.deserialize.return_value = mock_task
 
-        # Mock asyncio.run
-        with patch("asyncio.run", return_value=mock_task) as mock_asyncio_run:
+        # Mock the process-local runner
+        mock_runner = MagicMock()
+        mock_runner.run.return_value = mock_task
+        with patch(
+            "asynctasq.tasks.utils.execution_helpers.get_worker_runner", return_value=mock_runner
+        ):
             with pytest.raises(RuntimeError, match="Task failed"):
                 _sync_process_task_worker(b"serialized_task")
 
             mock_serializer_class.assert_called_once()
-            mock_asyncio_run.assert_called_once_with(
-                mock_serializer.deserialize(b"serialized_task")
-            )
+            mock_runner.run.assert_called_once_with(mock_serializer.deserialize(b"serialized_task"))
             mock_task.execute.assert_called_once()
+
+    @patch("asynctasq.tasks.services.serializer.TaskSerializer")
+    def test_sync_process_task_worker_reuses_task_serializer(self, mock_serializer_class):
+        """Test consecutive tasks in one process share a single TaskSerializer."""
+        mock_runner = MagicMock()
+        with patch(
+            "asynctasq.tasks.utils.execution_helpers.get_worker_runner", return_value=mock_runner
+        ):
+            for _ in range(3):
+                _sync_process_task_worker(b"serialized_task")
+
+        mock_serializer_class.assert_called_once()
+        assert mock_runner.run.call_count == 3
+
+    @pytest.mark.usefixtures("fresh_worker_runner")
+    @patch("asynctasq.tasks.services.serializer.TaskSerializer")
+    def test_sync_process_task_worker_reuses_event_loop(self, mock_serializer_class):
+        """Test consecutive tasks in one process deserialize on the same event loop."""
+        loops = []
+
+        async def deserialize(serialized_task):
+            loops.append(asyncio.get_running_loop())
+            return MagicMock()
+
+        mock_serializer_class.return_value.deserialize = deserialize
+
+        for _ in range(3):
+            _sync_process_task_worker(b"serialized_task")
+
+        assert len(loops) == 3
+        assert loops[0] is loops[1] is loops[2]
+
+    @patch("asynctasq.tasks.services.serializer.TaskSerializer")
+    def test_sync_process_task_worker_uses_warm_event_loop(self, mock_serializer_class):
+        """Test the worker deserializes on the warm event loop when the process has one."""
+        mock_task = MagicMock()
+        mock_task.execute.return_value = "task_result"
+        future = concurrent.futures.Future()
+        future.set_result(mock_task)
+        warm_loop = MagicMock()
+
+        with (
+            patch(
+                "asynctasq.tasks.infrastructure.process_pool_manager.get_warm_event_loop",
+                return_value=warm_loop,
+            ),
+            patch(
+                "asynctasq.tasks.utils.execution_helpers.asyncio.run_coroutine_threadsafe",
+                return_value=future,
+            ) as mock_run_coroutine,
+            patch("asynctasq.tasks.utils.execution_helpers.get_worker_runner") as mock_runner,
+        ):
+            result = _sync_process_task_worker(b"serialized_task")
+
+        assert result == "task_result"
+        mock_run_coroutine.assert_called_once_with(
+            mock_serializer_class.return_value.deserialize.return_value, warm_loop
+        )
+        mock_runner.assert_not_called()
+
+
+class TestWorkerRunner:
+    """Test the process-local runner used when no warm event loop exists."""
+
+    @pytest.mark.usefixtures("fresh_worker_runner")
+    def test_worker_runner_uses_loop_factory(self, monkeypatch: pytest.MonkeyPatch):
+        """Test the runner builds its loop with asynctasq.utils.loop's factory (uvloop)."""
+        created = []
+
+        def factory() -> asyncio.AbstractEventLoop:
+            new_loop = asyncio.new_event_loop()
+            created.append(new_loop)
+            return new_loop
+
+        monkeypatch.setattr(loop, "get_loop_factory", lambda: factory)
+
+        runner = execution_helpers.get_worker_runner()
+
+        assert runner.get_loop() is created[0]
+        assert execution_helpers.get_worker_runner() is runner
+
+    def test_worker_runner_registers_exit_finalizer(
+        self, fresh_worker_runner: list[tuple[Any, ...]]
+    ):
+        """Test the runner's close hook is a multiprocessing finalizer, registered once.
+
+        Finalize runs from Process._bootstrap under fork, forkserver and spawn,
+        whereas atexit is skipped by workers that exit via os._exit().
+        """
+        runner = execution_helpers.get_worker_runner()
+        execution_helpers.get_worker_runner()
+
+        assert fresh_worker_runner == [
+            (None, execution_helpers._close_worker_runner, (runner,), 10)
+        ]
+
+    def test_close_worker_runner_cleans_up_before_closing(
+        self, fresh_worker_runner: list[tuple[Any, ...]], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the exit hook runs AsyncTasQ cleanup on the runner's loop, then closes it."""
+        cleanup_loops = []
+
+        async def cleanup() -> None:
+            cleanup_loops.append(asyncio.get_running_loop())
+
+        monkeypatch.setattr(loop, "cleanup_asynctasq", cleanup)
+        runner_loop = execution_helpers.get_worker_runner().get_loop()
+        [(_, hook, args, _)] = fresh_worker_runner
+
+        hook(*args)
+
+        assert cleanup_loops == [runner_loop]
+        assert runner_loop.is_closed()
+
+    def test_close_worker_runner_closes_when_cleanup_fails(
+        self, fresh_worker_runner: list[tuple[Any, ...]], monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the exit hook still closes the runner if cleanup raises."""
+
+        async def cleanup() -> None:
+            raise RuntimeError("cleanup failed")
+
+        monkeypatch.setattr(loop, "cleanup_asynctasq", cleanup)
+        runner_loop = execution_helpers.get_worker_runner().get_loop()
+        [(_, hook, args, _)] = fresh_worker_runner
+
+        hook(*args)
+
+        assert runner_loop.is_closed()
@@ -1,6 +1,7 @@
 """Unit tests for asynctasq.config module."""
 
 from pydantic_core import ValidationError
+from pydantic_settings import BaseSettings
 import pytest
 
 from asynctasq.config import (
@@ -17,107 +18,90 @@ from asynctasq.config import (
 )
 
 
-class TestConfigValidation:
-    """Test Config validation in __post_init__."""
+@pytest.fixture(scope="module")
+def default_config() -> Config:
+    """Config built from defaults once for the tests that only read it."""
+    return Config()
 
-    def test_valid_config(self):
-        """Test that valid config passes validation."""
-        config = Config()
-        # Should not raise any exception
-        assert config.task_defaults.max_attempts == 3
 
-    @pytest.mark.parametrize("invalid_value", [-1, -5])
-    def test_default_max_attempts_validation(self, invalid_value):
-        """Test default_max_attempts validation."""
-        with pytest.raises(
-            (ValueError, ValidationError), match="max_attempts must be non-negative"
-        ):
-            TaskDefaultsConfig(max_attempts=invalid_value)
+@pytest.fixture
+def reset_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clear the Config singleton for one test and restore the previous one afterwards."""
+    monkeypatch.setattr(Config, "_instance", None)
 
-    @pytest.mark.parametrize("invalid_value", [-1, -5])
-    def test_default_retry_delay_validation(self, invalid_value):
-        """Test default_retry_delay validation."""
-        with pytest.raises((ValueError, ValidationError), match="retry_delay must be non-negative"):
-            TaskDefaultsConfig(retry_delay=invalid_value)
 
-    @pytest.mark.parametrize("invalid_value", ["linear", "random", ""])
-    def test_default_retry_strategy_validation(self, invalid_value):
-        """Test default_retry_strategy validation."""
-        with pytest.raises(
-            (ValueError, ValidationError), match="retry_strategy must be 'fixed' or 'exponential'"
-        ):
-            TaskDefaultsConfig(retry_strategy=invalid_value)
-
-    @pytest.mark.parametrize("invalid_value", [-1, 16, 100])
-    def test_redis_db_validation(self, invalid_value):
-        """Test redis_db validation."""
-        with pytest.raises((ValueError, ValidationError), match="db must be between 0 and 15"):
-            RedisConfig(db=invalid_value)
-
-    @pytest.mark.parametrize("invalid_value", [0, -1])
-    def test_redis_max_connections_validation(self, invalid_value):
-        """Test redis_max_connections validation."""
-        with pytest.raises((ValueError, ValidationError), match="max_connections must be positive"):
-            RedisConfig(max_connections=invalid_value)
-
-    @pytest.mark.parametrize("invalid_value", [0, -1])
-    def test_postgres_min_pool_size_validation(self, invalid_value):
-        """Test postgres_min_pool_size validation."""
-        with pytest.raises((ValueError, ValidationError), match="min_pool_size must be positive"):
-            PostgresConfig(min_pool_size=invalid_value)
-
-    @pytest.mark.parametrize("invalid_value", [0, -1])
-    def test_postgres_max_pool_size_validation(self, invalid_value):
-        """Test postgres_max_pool_size validation."""
-        with pytest.raises((ValueError, ValidationError), match="max_pool_size must be positive"):
-            PostgresConfig(max_pool_size=invalid_value)
-
-    def test_postgres_pool_size_ordering_validation(self):
-        """Test postgres pool size ordering validation."""
-        with pytest.raises(
-            (ValueError, ValidationError),
-            match="min_pool_size cannot be greater than max_pool_size",
-        ):
-            PostgresConfig(min_pool_size=10, max_pool_size=5)
-
-    @pytest.mark.parametrize("invalid_value", [0, -1])
-    def test_mysql_min_pool_size_validation(self, invalid_value):
-        """Test mysql_min_pool_size validation."""
-        with pytest.raises((ValueError, ValidationError), match="min_pool_size must be positive"):
-            MySQLConfig(min_pool_size=invalid_value)
-
-    @pytest.mark.parametrize("invalid_value", [0, -1])
-    def test_mysql_max_pool_size_validation(self, invalid_value):
-        """Test mysql_max_pool_size validation."""
-        with pytest.raises((ValueError, ValidationError), match="max_pool_size must be positive"):
-            MySQLConfig(max_pool_size=invalid_value)
-
-    def test_mysql_pool_size_ordering_validation(self):
-        """Test mysql pool size ordering validation."""
+def _validate_field(model: type[BaseSettings], field: str, value: object) -> None:
+    """Run only `field`'s validators, skipping settings sources and the other fields."""
+    model.__pydantic_validator__.validate_assignment(model.model_construct(), field, value)
+
+
+class TestConfigValidation:
+    """Test Config validation in __post_init__."""
+
+    def test_valid_config(self, default_config: Config):
+        """Test that valid config passes validation."""
+        assert default_config.task_defaults.max_attempts == 3
+
+    @pytest.mark.parametrize(
+        ("model", "field", "invalid_value", "message"),
+        [
+            (TaskDefaultsConfig, "max_attempts", -1, "max_attempts must be non-negative"),
+            (TaskDefaultsConfig, "max_attempts", -5, "max_attempts must be non-negative"),
+            (TaskDefaultsConfig, "retry_delay", -1, "retry_delay must be non-negative"),
+            (TaskDefaultsConfig, "retry_delay", -5, "retry_delay must be non-negative"),
+            *(
+                (
+                    TaskDefaultsConfig,
+                    "retry_strategy",
+                    value,
+                    "retry_strategy must be 'fixed' or 'exponential'",
+                )
+                for value in ("linear", "random", "")
+            ),
+            (RedisConfig, "db", -1, "db must be between 0 and 15"),
+            (RedisConfig, "db", 16, "db must be between 0 and 15"),
+            (RedisConfig, "db", 100, "db must be between 0 and 15"),
+            (RedisConfig, "max_connections", 0, "max_connections must be positive"),
+            (RedisConfig, "max_connections", -1, "max_connections must be positive"),
+            (PostgresConfig, "min_pool_size", 0, "min_pool_size must be positive"),
+            (PostgresConfig, "min_pool_size", -1, "min_pool_size must be positive"),
+            (PostgresConfig, "max_pool_size", 0, "max_pool_size must be positive"),
+            (PostgresConfig, "max_pool_size", -1, "max_pool_size must be positive"),
+            (MySQLConfig, "min_pool_size", 0, "min_pool_size must be positive"),
+            (MySQLConfig, "min_pool_size", -1, "min_pool_size must be positive"),
+            (MySQLConfig, "max_pool_size", 0, "max_pool_size must be positive"),
+            (MySQLConfig, "max_pool_size", -1, "max_pool_size must be positive"),
+        ],
+    )
+    def test_field_validation(
+        self, model: type[BaseSettings], field: str, invalid_value: object, message: str
+    ):
+        """Test each field validator rejects out-of-range values."""
+        with pytest.raises((ValueError, ValidationError), match=message):
+            _validate_field(model, field, invalid_value)
+
+    @pytest.mark.parametrize("model", [PostgresConfig, MySQLConfig])
+    def test_pool_size_ordering_validation(self, model: type[BaseSettings]):
+        """Test min_pool_size may not exceed max_pool_size."""
         with pytest.raises(
             (ValueError, ValidationError),
             match="min_pool_size cannot be greater than max_pool_size",
         ):
-            MySQLConfig(min_pool_size=10, max_pool_size=5)
+            model(min_pool_size=10, max_pool_size=5)
 
 
+@pytest.mark.usefixtures("reset_config")
 class TestConfigSingleton:
     """Test Config singleton behavior."""
 
     def test_get_returns_default_instance(self):
         """Test get() returns default instance when not set."""
-        # Reset instance
-        Config._instance = None
-
         config = Config.get()
         assert isinstance(config, Config)
         assert Config._instance is config
 
     def test_get_returns_same_instance(self):
         """Test get() returns the same instance."""
-        # Reset instance
-        Config._instance = None
-
         config1 = Config.get()
         config2 = Config.get()
 
@@ -125,9 +109,6 @@ class TestConfigSingleton:
 
     def test_set_creates_new_instance(self):
         """Test set() creates new instance with overrides."""
-        # Reset instance
-        Config._instance = None
-
         Config.set(driver="redis", redis=RedisConfig(url="redis://test:6379"))
 
         config = Config.get()
@@ -150,35 +131,31 @@ class TestConfigSingleton:
 class TestConfigGroupDefaults:
     """Test that config groups are initialized with defaults."""
 
-    def test_config_initializes_all_groups(self):
+    def test_config_initializes_all_groups(self, default_config: Config):
         """Test that all config groups are initialized with defaults."""
-        config = Config()
-
-        assert isinstance(config.redis, RedisConfig)
-        assert isinstance(config.sqs, SQSConfig)
-        assert isinstance(config.postgres, PostgresConfig)
-        assert isinstance(config.mysql, MySQLConfig)
-        assert isinstance(config.rabbitmq, RabbitMQConfig)
-        assert isinstance(config.events, EventsConfig)
-        assert isinstance(config.task_defaults, TaskDefaultsConfig)
-        assert isinstance(config.process_pool, ProcessPoolConfig)
-        assert isinstance(config.repository, RepositoryConfig)
-
-    def test_config_groups_have_correct_defaults(self):
+        assert isinstance(default_config.redis, RedisConfig)
+        assert isinstance(default_config.sqs, SQSConfig)
+        assert isinstance(default_config.postgres, PostgresConfig)
+        assert isinstance(default_config.mysql, MySQLConfig)
+        assert isinstance(default_config.rabbitmq, RabbitMQConfig)
+        assert isinstance(default_config.events, EventsConfig)
+        assert isinstance(default_config.task_defaults, TaskDefaultsConfig)
+        assert isinstance(default_config.process_pool, ProcessPoolConfig)
+        assert isinstance(default_config.repository, RepositoryConfig)
+
+    def test_config_groups_have_correct_defaults(self, default_config: Config):
         """Test that config groups have the correct default values."""
-        config = Config()
-
         # RedisConfig defaults
-        assert config.redis.url == "redis://localhost:6379"
-        assert config.redis.password is None
-        assert config.redis.db == 0
-        assert config.redis.max_connections == 100
+        assert default_config.redis.url == "redis://localhost:6379"
+        assert default_config.redis.password is None
+        assert default_config.redis.db == 0
+        assert default_config.redis.max_connections == 100
 
         # TaskDefaultsConfig defaults
-        assert config.task_defaults.queue == "default"
-        assert config.task_defaults.max_attempts == 3
-        assert config.task_defaults.retry_strategy == "exponential"
-        assert config.task_defaults.retry_delay == 60
+        assert default_config.task_defaults.queue == "default"
+        assert default_config.task_defaults.max_attempts == 3
+        assert default_config.task_defaults.retry_strategy == "exponential"
+        assert default_config.task_defaults.retry_delay == 60
 
         # RepositoryConfig defaults
-        assert config.repository.keep_completed_tasks is False
+        assert default_config.repository.keep_completed_tasks is False
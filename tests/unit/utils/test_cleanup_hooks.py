@@ -1,8 +1,11 @@
 """Unit tests for asynctasq.utils.cleanup_hooks module."""
 
 import asyncio
+from collections.abc import Generator
 import gc
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import cast
+from unittest.mock import MagicMock, patch
+import weakref
 
 import pytest
 
@@ -14,22 +17,52 @@ from asynctasq.utils.cleanup_hooks import (
 )
 
 
+@pytest.fixture
+def mock_loop() -> MagicMock:
+    """Stand-in event loop, fresh per test since register() patches its close()."""
+    return MagicMock()
+
+
+@pytest.fixture
+def fresh_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    """Real event loop set as current for one test, closed afterwards if the test didn't."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    if not loop.is_closed():
+        loop.close()
+
+
+class _FakeLoop:
+    """Event loop stub with just the methods _RegistryEntry._run_cleanup_sync() calls."""
+
+    def __init__(self, *, closed: bool = False, running: bool = False) -> None:
+        self.closed = closed
+        self.running = running
+        self.run_until_complete = MagicMock()
+        self.close = MagicMock()
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def is_running(self) -> bool:
+        return self.running
+
+
 class TestRegistryEntry:
     """Test _RegistryEntry class."""
 
-    def test_init(self):
+    def test_init(self, mock_loop: MagicMock):
         """Test _RegistryEntry initialization."""
-        mock_loop = MagicMock()
         entry = _RegistryEntry(mock_loop)
 
         assert entry.loop == mock_loop
         assert entry.callbacks == []
-        assert entry._original_close is None
         assert not entry._patched
 
-    def test_add_callback(self):
+    def test_add_callback(self, mock_loop: MagicMock):
         """Test adding callbacks."""
-        mock_loop = MagicMock()
         entry = _RegistryEntry(mock_loop)
 
         callback1 = MagicMock()
@@ -41,9 +74,8 @@ class TestRegistryEntry:
 
         assert entry.callbacks == [callback1, callback2]
 
-    def test_remove_callback(self):
+    def test_remove_callback(self, mock_loop: MagicMock):
         """Test removing callbacks."""
-        mock_loop = MagicMock()
         entry = _RegistryEntry(mock_loop)
 
         callback1 = MagicMock()
@@ -58,9 +90,8 @@ class TestRegistryEntry:
         assert callback1 not in entry.callbacks
         assert entry.callbacks == [callback2]
 
-    def test_patch_loop_close(self):
+    def test_patch_loop_close(self, mock_loop: MagicMock):
         """Test patching loop close method."""
-        mock_loop = MagicMock()
         original_close = MagicMock()
         mock_loop.close = original_close
 
@@ -68,12 +99,40 @@ class TestRegistryEntry:
         entry.patch_loop_close()
 
         assert entry._patched
-        assert entry._original_close == original_close
         assert mock_loop.close != original_close  # Should be replaced
 
-    def test_patch_loop_close_already_patched(self):
+        mock_loop.close()
+        original_close.assert_called_once_with()
+
+    def test_patched_entry_does_not_keep_loop_alive(self):
+        """Test a patched entry holds its loop weakly, so the loop can be collected."""
+        loop = _FakeLoop()
+        entry = _RegistryEntry(cast(asyncio.AbstractEventLoop, loop))
+        entry.patch_loop_close()
+        loop_ref = weakref.ref(loop)
+
+        del loop
+        # The patched close() forms a loop -> closure -> bound close -> loop cycle
+        gc.collect()
+
+        assert loop_ref() is None
+        with pytest.raises(RuntimeError, match="garbage collected"):
+            _ = entry.loop
+
+    def test_cleanup_runs_when_unclosed_loop_is_collected(self):
+        """Test callbacks still run when a collected loop's __del__ closes it."""
+        callback = MagicMock()
+        loop = asyncio.new_event_loop()
+        register(callback, loop=loop)
+
+        with pytest.warns(ResourceWarning, match="unclosed event loop"):
+            del loop
+            gc.collect()
+
+        callback.assert_called_once_with()
+
+    def test_patch_loop_close_already_patched(self, mock_loop: MagicMock):
         """Test patch_loop_close does nothing if already patched."""
-        mock_loop = MagicMock()
         entry = _RegistryEntry(mock_loop)
 
         entry._patched = True
@@ -82,17 +141,15 @@ class TestRegistryEntry:
         # Should not modify anything
         assert entry._patched
 
-    def test_run_cleanup_sync_no_callbacks(self):
+    def test_run_cleanup_sync_no_callbacks(self, mock_loop: MagicMock):
         """Test _run_cleanup_sync with no callbacks."""
-        mock_loop = MagicMock()
         entry = _RegistryEntry(mock_loop)
 
         # Should not raise any exception
         entry._run_cleanup_sync()
 
-    def test_run_cleanup_sync_sync_callback(self):
+    def test_run_cleanup_sync_sync_callback(self, mock_loop: MagicMock):
         """Test _run_cleanup_sync with sync callback."""
-        mock_loop = MagicMock()
         entry = _RegistryEntry(mock_loop)
 
         callback = MagicMock()
@@ -104,48 +161,42 @@ class TestRegistryEntry:
 
     def test_run_cleanup_sync_async_callback_loop_running(self):
         """Test _run_cleanup_sync with async callback when loop is running."""
-        mock_loop = MagicMock()
-        mock_loop.is_closed.return_value = False
-        mock_loop.is_running.return_value = True  # Loop is running
-        entry = _RegistryEntry(mock_loop)
+        loop = _FakeLoop(running=True)
+        entry = _RegistryEntry(cast(asyncio.AbstractEventLoop, loop))
+
+        async def async_callback():
+            pass
 
-        async_callback = AsyncMock()
         entry.add_callback(async_callback)
 
-        with (
-            patch("asyncio.iscoroutinefunction", return_value=True),
-            patch("asynctasq.utils.cleanup_hooks.logger") as mock_logger,
-        ):
+        with patch("asynctasq.utils.cleanup_hooks.logger") as mock_logger:
             entry._run_cleanup_sync()
 
         # Should NOT have called run_until_complete when loop is running
-        mock_loop.run_until_complete.assert_not_called()
+        loop.run_until_complete.assert_not_called()
         # Should log warning
         mock_logger.warning.assert_called_once()
 
     def test_run_cleanup_sync_async_callback_loop_closed(self):
         """Test _run_cleanup_sync with async callback when loop is closed."""
-        mock_loop = MagicMock()
-        mock_loop.is_closed.return_value = True
-        entry = _RegistryEntry(mock_loop)
+        loop = _FakeLoop(closed=True)
+        entry = _RegistryEntry(cast(asyncio.AbstractEventLoop, loop))
+
+        async def async_callback():
+            pass
 
-        async_callback = AsyncMock()
         entry.add_callback(async_callback)
 
-        with (
-            patch("asyncio.iscoroutinefunction", return_value=True),
-            patch("asynctasq.utils.cleanup_hooks.logger") as mock_logger,
-        ):
+        with patch("asynctasq.utils.cleanup_hooks.logger") as mock_logger:
             entry._run_cleanup_sync()
 
         # Should not call run_until_complete
-        mock_loop.run_until_complete.assert_not_called()
+        loop.run_until_complete.assert_not_called()
         # Should log warning
         mock_logger.warning.assert_called_once()
 
-    def test_run_cleanup_sync_callback_exception(self):
+    def test_run_cleanup_sync_callback_exception(self, mock_loop: MagicMock):
         """Test _run_cleanup_sync handles callback exceptions."""
-        mock_loop = MagicMock()
         entry = _RegistryEntry(mock_loop)
 
         callback = MagicMock(side_effect=Exception("Test error"))
@@ -157,9 +208,8 @@ class TestRegistryEntry:
         # Should log exception but not raise
         mock_logger.exception.assert_called_once()
 
-    def test_close_with_cleanup_calls_original(self):
+    def test_close_with_cleanup_calls_original(self, mock_loop: MagicMock):
         """Test that close_with_cleanup calls original close method."""
-        mock_loop = MagicMock()
         original_close = MagicMock()
         mock_loop.close = original_close
 
@@ -176,9 +226,8 @@ class TestRegistryEntry:
 class TestRegisterFunction:
     """Test register function."""
 
-    def test_register_with_running_loop(self):
+    def test_register_with_running_loop(self, mock_loop: MagicMock):
         """Test register with running loop."""
-        mock_loop = MagicMock()
         callback = MagicMock()
 
         with patch("asyncio.get_running_loop", return_value=mock_loop):
@@ -187,18 +236,16 @@ class TestRegisterFunction:
         # Should have created registry entry and patched loop
         # (This is hard to test directly due to WeakKeyDictionary)
 
-    def test_register_with_no_running_loop_uses_event_loop(self):
+    def test_register_with_no_running_loop_uses_event_loop(
+        self, mock_loop: MagicMock, no_running_loop: None
+    ):
         """Test register with no running loop uses get_event_loop."""
-        mock_loop = MagicMock()
         callback = MagicMock()
 
-        with (
-            patch("asyncio.get_running_loop", side_effect=RuntimeError()),
-            patch("asyncio.get_event_loop", return_value=mock_loop),
-        ):
+        with patch("asyncio.get_event_loop", return_value=mock_loop):
             register(callback)
 
-    def test_register_with_no_loop_available(self):
+    def test_register_with_no_loop_available(self, no_running_loop: None):
         """Test register with no loop available logs warning."""
         callback = MagicMock()
 
@@ -207,7 +254,6 @@ class TestRegisterFunction:
         mock_policy.get_event_loop.side_effect = RuntimeError()
 
         with (
-            patch("asyncio.get_running_loop", side_effect=RuntimeError()),
             patch("asyncio.get_event_loop_policy", return_value=mock_policy),
             patch("asynctasq.utils.cleanup_hooks.logger") as mock_logger,
         ):
@@ -215,9 +261,8 @@ class TestRegisterFunction:
 
         mock_logger.warning.assert_called_once()
 
-    def test_register_with_explicit_loop(self):
+    def test_register_with_explicit_loop(self, mock_loop: MagicMock):
         """Test register with explicitly passed loop."""
-        mock_loop = MagicMock()
         callback = MagicMock()
 
         register(callback, loop=mock_loop)
@@ -225,9 +270,8 @@ class TestRegisterFunction:
         # Should work without calling get_running_loop
         # (Hard to test directly due to WeakKeyDictionary)
 
-    def test_register_multiple_callbacks(self):
+    def test_register_multiple_callbacks(self, mock_loop: MagicMock):
         """Test registering multiple callbacks."""
-        mock_loop = MagicMock()
         callback1 = MagicMock()
         callback2 = MagicMock()
 
@@ -239,39 +283,32 @@ class TestRegisterFunction:
 class TestUnregisterFunction:
     """Test unregister function."""
 
-    def test_unregister_with_running_loop(self):
+    def test_unregister_with_running_loop(self, mock_loop: MagicMock):
         """Test unregister with running loop."""
-        mock_loop = MagicMock()
         callback = MagicMock()
 
         with patch("asyncio.get_running_loop", return_value=mock_loop):
             unregister(callback)
 
-    def test_unregister_with_no_running_loop_uses_event_loop(self):
+    def test_unregister_with_no_running_loop_uses_event_loop(
+        self, mock_loop: MagicMock, no_running_loop: None
+    ):
         """Test unregister with no running loop uses get_event_loop."""
-        mock_loop = MagicMock()
         callback = MagicMock()
 
-        with (
-            patch("asyncio.get_running_loop", side_effect=RuntimeError()),
-            patch("asyncio.get_event_loop", return_value=mock_loop),
-        ):
+        with patch("asyncio.get_event_loop", return_value=mock_loop):
             unregister(callback)
 
-    def test_unregister_with_no_loop_available(self):
+    def test_unregister_with_no_loop_available(self, no_running_loop: None):
         """Test unregister with no loop available does nothing."""
         callback = MagicMock()
 
-        with (
-            patch("asyncio.get_running_loop", side_effect=RuntimeError()),
-            patch("asyncio.get_event_loop", side_effect=RuntimeError()),
-        ):
+        with patch("asyncio.get_event_loop", side_effect=RuntimeError()):
             # Should not raise
             unregister(callback)
 
-    def test_unregister_with_explicit_loop(self):
+    def test_unregister_with_explicit_loop(self, mock_loop: MagicMock):
         """Test unregister with explicitly passed loop."""
-        mock_loop = MagicMock()
         callback = MagicMock()
 
         unregister(callback, loop=mock_loop)
@@ -280,10 +317,8 @@ class TestUnregisterFunction:
 class TestGetRegistryEntry:
     """Test _get_registry_entry function."""
 
-    def test_get_registry_entry_with_running_loop(self):
+    def test_get_registry_entry_with_running_loop(self, mock_loop: MagicMock):
         """Test _get_registry_entry with running loop."""
-        mock_loop = MagicMock()
-
         with (
             patch("asyncio.get_running_loop", return_value=mock_loop),
             patch("asynctasq.utils.cleanup_hooks._registry") as mock_registry,
@@ -296,16 +331,12 @@ class TestGetRegistryEntry:
             assert result == mock_entry
             mock_registry.get.assert_called_once_with(mock_loop)
 
-    def test_get_registry_entry_no_running_loop(self):
+    def test_get_registry_entry_no_running_loop(self, no_running_loop: None):
         """Test _get_registry_entry with no running loop returns None."""
-        with patch("asyncio.get_running_loop", side_effect=RuntimeError()):
-            result = _get_registry_entry()
-
-            assert result is None
+        assert _get_registry_entry() is None
 
-    def test_get_registry_entry_with_explicit_loop(self):
+    def test_get_registry_entry_with_explicit_loop(self, mock_loop: MagicMock):
         """Test _get_registry_entry with explicit loop."""
-        mock_loop = MagicMock()
 
         with patch("asynctasq.utils.cleanup_hooks._registry") as mock_registry:
             mock_entry = MagicMock()
@@ -321,71 +352,55 @@ class TestCleanupHooksIntegration:
     """Integration tests for cleanup hooks."""
 
     @pytest.mark.asyncio
-    async def test_cleanup_hooks_run_on_loop_close(self):
+    async def test_cleanup_hooks_run_on_loop_close(self, fresh_loop: asyncio.AbstractEventLoop):
         """Test that cleanup hooks are actually called when loop closes."""
-        # Create a new event loop for this test
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            callback_called = False
+        callback_called = False
 
-            def sync_callback():
-                nonlocal callback_called
-                callback_called = True
+        def sync_callback():
+            nonlocal callback_called
+            callback_called = True
 
-            # Register callback
-            register(sync_callback, loop=loop)
+        # Register callback
+        register(sync_callback, loop=fresh_loop)
 
-            # Close the loop
-            loop.close()
+        # Close the loop
+        fresh_loop.close()
 
-            # Callback should have been called
-            assert callback_called
+        # Callback should have been called
+        assert callback_called
 
-        finally:
-            # Clean up
-            asyncio.set_event_loop(None)
-
-    def test_async_cleanup_hooks_run_on_loop_close(self):
+    def test_async_cleanup_hooks_run_on_loop_close(self, fresh_loop: asyncio.AbstractEventLoop):
         """Test that async cleanup hooks are called when loop closes."""
-        # Create a new event loop for this test
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            callback_called = False
+        callback_called = False
 
-            async def async_callback():
-                nonlocal callback_called
-                callback_called = True
+        async def async_callback():
+            nonlocal callback_called
+            callback_called = True
 
-            # Register callback
-            register(async_callback, loop=loop)
+        # Register callback
+        register(async_callback, loop=fresh_loop)
 
-            # Close the loop
-            loop.close()
+        # Close the loop
+        fresh_loop.close()
 
-            # For async callbacks, they may not run if there's a loop conflict
-            # This is expected behavior - async cleanup requires a running loop
-            # So we don't assert that callback_called is True
-
-        finally:
-            # Clean up
-            asyncio.set_event_loop(None)
+        # For async callbacks, they may not run if there's a loop conflict
+        # This is expected behavior - async cleanup requires a running loop
+        # So we don't assert that callback_called is True
 
     def test_weak_references_cleanup_on_loop_deletion(self):
         """Test that registry entries are cleaned up when loops are deleted."""
-        # Create a loop
         loop = asyncio.new_event_loop()
-
-        # Register something
-        callback = MagicMock()
-        register(callback, loop=loop)
-
-        # Delete the loop
-        del loop
+        register(MagicMock(), loop=loop)
+        entry = _get_registry_entry(loop)
+        assert entry is not None
+        loop.close()
+
+        loop_ref = weakref.ref(loop)
+        entry_ref = weakref.ref(entry)
+        del loop, entry
+        # The patched close() forms a loop/closure cycle that an automatic collection may
+        # already have promoted past generation 0, so only a full collection is reliable
         gc.collect()
 
-        # Registry should be empty (WeakKeyDictionary behavior)
-        # This is hard to test directly, but we can check that no exceptions occur
+        assert loop_ref() is None
+        assert entry_ref() is None